@@ -17,15 +17,32 @@ Public API:
 __version__ = "0.6.2"
 __author__ = "Engin Kırmacı"
 
-# Re-export commonly used classes for convenience
-from lumux.app_context import AppContext
-from lumux.hue_bridge import HueBridge
-from lumux.bridge_client import BridgeClient
-from lumux.capture import ScreenCapture
-from lumux.zones import ZoneProcessor
-from lumux.sync import SyncController
-from lumux.mode_manager import ModeManager
-from lumux.entertainment import EntertainmentStream
-from lumux.reading_mode import ReadingModeController
-from lumux.black_bar_detector import BlackBarDetector
-from lumux.colors import ColorAnalyzer
+import importlib
+
+# Re-export commonly used classes for convenience. They are resolved on
+# first access, so importing any lumux module doesn't pull in GStreamer,
+# NumPy and the network stack up front
+_EXPORTS = {
+    "AppContext": "lumux.app_context",
+    "HueBridge": "lumux.hue_bridge",
+    "BridgeClient": "lumux.bridge_client",
+    "ScreenCapture": "lumux.capture",
+    "ZoneProcessor": "lumux.zones",
+    "SyncController": "lumux.sync",
+    "ModeManager": "lumux.mode_manager",
+    "EntertainmentStream": "lumux.entertainment",
+    "ReadingModeController": "lumux.reading_mode",
+    "BlackBarDetector": "lumux.black_bar_detector",
+    "ColorAnalyzer": "lumux.colors",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'lumux' has no attribute '{name}'")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
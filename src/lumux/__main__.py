@@ -9,6 +9,7 @@ gi.require_version("Adw", "1")
 from gi.repository import Gtk, Adw, Gio, GLib, Gdk
 from lumux.config.settings_manager import SettingsManager
 from lumux.gui.main_window import MainWindow
+from lumux.gui.tray_icon import prewarm_tray
 from lumux.app_context import AppContext
 from lumux.utils.logging import timed_print
 
@@ -135,6 +136,10 @@ class LumuxApp(Adw.Application):
             self.main_window.present()
             return
 
+        # Only the primary instance gets here; start the tray now so its
+        # launch overlaps connecting to the bridge and building the window
+        prewarm_tray()
+
         # Apply Adwaita dark color scheme
         style_manager = Adw.StyleManager.get_default()
         style_manager.set_color_scheme(Adw.ColorScheme.PREFER_DARK)
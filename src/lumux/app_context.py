@@ -1,20 +1,19 @@
 """Application wiring and shared services."""
 
 import threading
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, replace
+from typing import Optional, Tuple
 
 from lumux.config.settings_manager import SettingsManager
 from lumux.hue_bridge import HueBridge
-from lumux.capture import ScreenCapture
-from lumux.colors import ColorAnalyzer
 from lumux.entertainment import EntertainmentStream
 from lumux.sync import SyncController
-from lumux.zones import ZoneProcessor
 from lumux.mode_manager import ModeManager
 from lumux.utils.logging import timed_print
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BridgeStatus:
     connected: bool
     configured: bool
@@ -26,6 +25,12 @@ class BridgeStatus:
 
 class AppContext:
     def __init__(self, settings: SettingsManager):
+        # Imported here rather than at module level: they load NumPy and
+        # initialize GStreamer, which only an actual app instance needs
+        from lumux.capture import ScreenCapture
+        from lumux.colors import ColorAnalyzer
+        from lumux.zones import ZoneProcessor
+
         self.settings = settings
 
         self.bridge = HueBridge(settings.hue.bridge_ip, settings.hue.app_key)
@@ -75,6 +80,9 @@ class AppContext:
 
         self._settings_lock = threading.Lock()
 
+        # Last probed bridge status and its time.monotonic() timestamp
+        self._bridge_status_cache: Optional[Tuple[BridgeStatus, float]] = None
+
     def start(self) -> BridgeStatus:
         """Start background workers and attempt bridge connection."""
         return self.get_bridge_status(attempt_connect=True)
@@ -112,15 +120,17 @@ class AppContext:
     def apply_settings(self) -> None:
         """Apply current settings to live components atomically."""
         with self._settings_lock:
+            # Bridge or zone may have changed; next status query re-probes
+            self._bridge_status_cache = None
+
             hue = self.settings.hue
             if (self.bridge.bridge_ip, self.bridge.app_key) != (
                 hue.bridge_ip,
                 hue.app_key,
             ):
+                # HueBridge.client reconnects on the next call
                 self.bridge.bridge_ip = hue.bridge_ip
                 self.bridge.app_key = hue.app_key
-                self.bridge.hue = None
-                self.bridge.bridge = None
 
             capture = self.settings.capture
             self.capture.update_scale_factor(capture.scale_factor)
@@ -173,8 +183,32 @@ class AppContext:
         except Exception as e:
             timed_print(f"Error persisting capture restore token: {e}")
 
-    def get_bridge_status(self, attempt_connect: bool = False) -> BridgeStatus:
-        """Return current bridge status, optionally attempting a connection."""
+    def get_bridge_status(
+        self,
+        attempt_connect: bool = False,
+        max_age: float = 5.0,
+        force: bool = False,
+    ) -> BridgeStatus:
+        """Return current bridge status, optionally attempting a connection.
+
+        Results are cached for ``max_age`` seconds so repeated UI refreshes do
+        not each hit the network.
+
+        Args:
+            attempt_connect: Whether to attempt connection if not connected
+            max_age: Maximum age in seconds of a cached status to reuse
+            force: Ignore the cache and probe the bridge
+        """
+        cached = self._bridge_status_cache
+        if not force and cached is not None:
+            status, timestamp = cached
+            fresh = time.monotonic() - timestamp <= max_age
+            if fresh and (status.connected or not attempt_connect):
+                # Streaming state is local and cheap, so always report it live
+                return replace(
+                    status, entertainment_connected=self._is_entertainment_connected()
+                )
+
         configured = bool(self.settings.hue.bridge_ip and self.settings.hue.app_key)
         connected = self.bridge.test_connection()
 
@@ -191,31 +225,39 @@ class AppContext:
                     entertainment_channel_count = len(config.get("channels", []))
                     break
 
-        entertainment_connected = (
-            self.entertainment_stream is not None
-            and self.entertainment_stream.is_connected()
-        )
-
-        return BridgeStatus(
+        status = BridgeStatus(
             connected=connected,
             configured=configured,
             bridge_ip=self.settings.hue.bridge_ip,
             entertainment_zone_name=entertainment_zone_name,
             entertainment_channel_count=entertainment_channel_count,
-            entertainment_connected=entertainment_connected,
+            entertainment_connected=self._is_entertainment_connected(),
         )
+        self._bridge_status_cache = (status, time.monotonic())
+        return status
 
-    def get_bridge_status_async(self, callback, attempt_connect: bool = False):
+    def _is_entertainment_connected(self) -> bool:
+        return (
+            self.entertainment_stream is not None
+            and self.entertainment_stream.is_connected()
+        )
+
+    def get_bridge_status_async(
+        self, callback, attempt_connect: bool = False, force: bool = False
+    ):
         """Fetch bridge status in a background thread and deliver via callback.
 
         Args:
             callback: Function to call with BridgeStatus result
             attempt_connect: Whether to attempt connection if not connected
+            force: Ignore the cached status and probe the bridge
         """
 
         def _worker():
             try:
-                status = self.get_bridge_status(attempt_connect=attempt_connect)
+                status = self.get_bridge_status(
+                    attempt_connect=attempt_connect, force=force
+                )
             except Exception as e:
                 timed_print(f"Error getting bridge status: {e}")
                 status = BridgeStatus(
@@ -9,8 +9,30 @@ import numpy as np
 from typing import Optional, Tuple
 from dataclasses import dataclass
 
+# ITU-R BT.601 luma weights for R, G, B in Q8 fixed point (sum to 256)
+_LUMA_WEIGHTS_Q8 = (77, 150, 29)
 
-@dataclass
+# Pixels averaged per row or column at most (roughly) when measuring bars
+_LINE_SAMPLES = 256
+
+# Rows and columns of the pixel grid compared to spot an unchanged frame
+_FINGERPRINT_GRID = 16
+
+
+def _luminance_q8(image: np.ndarray) -> np.ndarray:
+    """Return the Q8 luminance of an RGB image as a contiguous uint16 array.
+
+    Channel by channel elementwise ops stay fast whatever the image's
+    strides, where a matmul over a strided channel view does not.
+    """
+    r_weight, g_weight, b_weight = _LUMA_WEIGHTS_Q8
+    luminance = np.multiply(image[..., 0], r_weight, dtype=np.uint16)
+    luminance += np.multiply(image[..., 1], g_weight, dtype=np.uint16)
+    luminance += np.multiply(image[..., 2], b_weight, dtype=np.uint16)
+    return luminance
+
+
+@dataclass(slots=True)
 class CropRegion:
     """Represents a detected crop region."""
 
@@ -71,6 +93,9 @@ class BlackBarDetector:
         self._current_crop = CropRegion()
         self._target_crop = CropRegion()
         self._image_size: Optional[Tuple[int, int]] = None
+        # Sampled pixels of the last analyzed frame, to skip re-detecting
+        # a static or paused picture
+        self._last_fingerprint: Optional[Tuple[int, int, bytes]] = None
 
         self._min_content_ratio = 0.5
 
@@ -80,10 +105,12 @@ class BlackBarDetector:
         if not enabled:
             self._current_crop = CropRegion()
             self._target_crop = CropRegion()
+            self._last_fingerprint = None
 
     def set_threshold(self, threshold: int) -> None:
         """Set luminance threshold (0-50)."""
         self.threshold = max(0, min(50, threshold))
+        self._last_fingerprint = None
 
     def set_detection_rate(self, rate: int) -> None:
         """Set detection rate (frames between detection runs)."""
@@ -124,6 +151,7 @@ class BlackBarDetector:
         if crop_width <= 0 or crop_height <= 0:
             self._current_crop = CropRegion(0, 0, width, height)
             self._target_crop = CropRegion(0, 0, width, height)
+            self._last_fingerprint = None
             return None
 
         if self._should_crop(width, height):
@@ -162,54 +190,87 @@ class BlackBarDetector:
         Analyzes row and column luminance to find contiguous black regions.
         Works directly on numpy array to avoid PIL conversions.
         """
-        try:
-            if image.shape[2] == 4:
-                img_array = image[:, :, :3]
-            elif image.shape[2] == 1:
-                img_array = np.stack([image[:, :, 0]] * 3, axis=2)
-            else:
-                img_array = image
-
-            luminance = (
-                0.299 * img_array[:, :, 0]
-                + 0.587 * img_array[:, :, 1]
-                + 0.114 * img_array[:, :, 2]
-            )
-
-            row_luminance = np.mean(luminance, axis=1)
-            col_luminance = np.mean(luminance, axis=0)
-
-            top = self._find_black_region(row_luminance, from_start=True)
-            bottom = self._find_black_region(row_luminance, from_start=False)
-            left = self._find_black_region(col_luminance, from_start=True)
-            right = self._find_black_region(col_luminance, from_start=False)
-
-            min_width = int(width * self._min_content_ratio)
-            min_height = int(height * self._min_content_ratio)
-
-            if width - left - right < min_width:
-                left = 0
-                right = 0
-
-            if height - top - bottom < min_height:
-                top = 0
-                bottom = 0
-
-            max_crop_x = width // 2 - 1
-            max_crop_y = height // 2 - 1
-            left = min(left, max_crop_x)
-            right = min(right, max_crop_x)
-            top = min(top, max_crop_y)
-            bottom = min(bottom, max_crop_y)
-
-            self._target_crop = CropRegion(
-                left=left,
-                top=top,
-                right=width - right,
-                bottom=height - bottom,
+        channels = image.shape[2] if image.ndim == 3 else 1
+        if channels == 3:
+            img_array = image
+        elif channels == 4:
+            img_array = image[:, :, :3]
+        elif channels == 1:
+            # Gray weighted by luma weights that sum to 1 is itself, so
+            # repeat it as a view instead of stacking three copies
+            img_array = np.broadcast_to(
+                image.reshape(height, width, 1), (height, width, 3)
             )
-        except Exception:
+        else:
+            # Not a picture this detector understands; leave it uncropped
             self._target_crop = CropRegion(0, 0, width, height)
+            return
+
+        # The same picture gives the same bars; the current target
+        # crop stands until a sampled pixel changes
+        fingerprint = (
+            width,
+            height,
+            img_array[
+                :: max(1, height // _FINGERPRINT_GRID),
+                :: max(1, width // _FINGERPRINT_GRID),
+            ].tobytes(),
+        )
+        if fingerprint == self._last_fingerprint:
+            return
+
+        # Bar edges need full resolution only along the axis they are
+        # found on; a line's average is taken over a sparser sample
+        col_step = max(1, width // _LINE_SAMPLES)
+        row_step = max(1, height // _LINE_SAMPLES)
+
+        # Fixed-point luminance fits in uint16, so no float64 image is
+        # allocated; only the H + W averages are converted to float
+        if col_step == 1 and row_step == 1:
+            row_source = col_source = _luminance_q8(img_array)
+        else:
+            row_source = _luminance_q8(img_array[:, ::col_step])
+            col_source = _luminance_q8(img_array[::row_step])
+
+        row_luminance = row_source.sum(axis=1, dtype=np.uint32) / (
+            256 * row_source.shape[1]
+        )
+        col_luminance = col_source.sum(axis=0, dtype=np.uint32) / (
+            256 * col_source.shape[0]
+        )
+
+        top = self._find_black_region(row_luminance, from_start=True)
+        bottom = self._find_black_region(row_luminance, from_start=False)
+        left = self._find_black_region(col_luminance, from_start=True)
+        right = self._find_black_region(col_luminance, from_start=False)
+
+        min_width = int(width * self._min_content_ratio)
+        min_height = int(height * self._min_content_ratio)
+
+        if width - left - right < min_width:
+            left = 0
+            right = 0
+
+        if height - top - bottom < min_height:
+            top = 0
+            bottom = 0
+
+        max_crop_x = width // 2 - 1
+        max_crop_y = height // 2 - 1
+        left = min(left, max_crop_x)
+        right = min(right, max_crop_x)
+        top = min(top, max_crop_y)
+        bottom = min(bottom, max_crop_y)
+
+        self._target_crop = CropRegion(
+            left=left,
+            top=top,
+            right=width - right,
+            bottom=height - bottom,
+        )
+        # Remembered only once its crop is in place, so a detection that
+        # fails partway is retried on the same picture
+        self._last_fingerprint = fingerprint
 
     def _find_black_region(self, luminance: np.ndarray, from_start: bool) -> int:
         """Find length of contiguous black region from start or end.
@@ -221,58 +282,51 @@ class BlackBarDetector:
         Returns:
             Number of contiguous black pixels
         """
-        if from_start:
-            iterator = range(len(luminance))
-        else:
-            iterator = range(len(luminance) - 1, -1, -1)
+        # First non-black index, found in one vectorized pass
+        content = luminance > self.threshold
+        if not from_start:
+            content = content[::-1]
 
-        count = 0
-        for i in iterator:
-            if luminance[i] <= self.threshold:
-                count += 1
-            else:
-                break
-
-        return count
+        if not content.any():
+            return len(luminance)
+        return int(np.argmax(content))
 
     def _apply_smoothing(self, width: int, height: int) -> None:
         """Apply smooth transition between current and target crop."""
-        self._current_crop.left = int(
-            self._current_crop.left
-            + self.smooth_factor * (self._target_crop.left - self._current_crop.left)
-        )
-        self._current_crop.top = int(
-            self._current_crop.top
-            + self.smooth_factor * (self._target_crop.top - self._current_crop.top)
-        )
-        self._current_crop.right = int(
-            self._current_crop.right
-            + self.smooth_factor * (self._target_crop.right - self._current_crop.right)
-        )
-        self._current_crop.bottom = int(
-            self._current_crop.bottom
-            + self.smooth_factor
-            * (self._target_crop.bottom - self._current_crop.bottom)
-        )
-
-        self._current_crop.left = max(0, min(width - 1, self._current_crop.left))
-        self._current_crop.top = max(0, min(height - 1, self._current_crop.top))
-        self._current_crop.right = max(1, min(width, self._current_crop.right))
-        self._current_crop.bottom = max(1, min(height, self._current_crop.bottom))
-
-        if self._current_crop.right <= self._current_crop.left:
-            self._current_crop.right = width
-            self._current_crop.left = 0
-        if self._current_crop.bottom <= self._current_crop.top:
-            self._current_crop.bottom = height
-            self._current_crop.top = 0
-
-        if self._current_crop.right - self._current_crop.left < 2:
-            self._current_crop.left = 0
-            self._current_crop.right = width
-        if self._current_crop.bottom - self._current_crop.top < 2:
-            self._current_crop.top = 0
-            self._current_crop.bottom = height
+        # Work on locals and write the crop back once; four scalars are
+        # cheaper in plain Python than as attribute traffic or NumPy calls
+        current = self._current_crop
+        target = self._target_crop
+        factor = self.smooth_factor
+
+        left = int(current.left + factor * (target.left - current.left))
+        top = int(current.top + factor * (target.top - current.top))
+        right = int(current.right + factor * (target.right - current.right))
+        bottom = int(current.bottom + factor * (target.bottom - current.bottom))
+
+        left = max(0, min(width - 1, left))
+        top = max(0, min(height - 1, top))
+        right = max(1, min(width, right))
+        bottom = max(1, min(height, bottom))
+
+        if right <= left:
+            right = width
+            left = 0
+        if bottom <= top:
+            bottom = height
+            top = 0
+
+        if right - left < 2:
+            left = 0
+            right = width
+        if bottom - top < 2:
+            top = 0
+            bottom = height
+
+        current.left = left
+        current.top = top
+        current.right = right
+        current.bottom = bottom
 
     def _should_crop(self, width: int, height: int) -> bool:
         """Check if current crop region requires actual cropping."""
@@ -290,3 +344,4 @@ class BlackBarDetector:
         self._current_crop = CropRegion()
         self._target_crop = CropRegion()
         self._image_size = None
+        self._last_fingerprint = None
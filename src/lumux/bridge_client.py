@@ -4,9 +4,7 @@ Replaces python-hue-v2 with a clean, consistent interface to the Hue v2 REST API
 """
 
 import json
-import ssl
 import time
-import urllib.request
 import urllib3
 from typing import Any, Dict, List, Optional
 
@@ -15,6 +13,33 @@ import requests
 # Disable SSL warnings once at module level
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# Color PUTs always have the same shape, so their bodies are formatted from
+# pre-encoded templates instead of building and serializing dicts per call
+_COLOR_BODY = (
+    b'{"color":{"xy":{"x":%.5f,"y":%.5f}},'
+    b'"dimming":{"brightness":%.2f},"on":{"on":true}}'
+)
+_COLOR_BODY_WITH_DURATION = (
+    b'{"color":{"xy":{"x":%.5f,"y":%.5f}},'
+    b'"dimming":{"brightness":%.2f},"on":{"on":true},'
+    b'"dynamics":{"duration":%d}}'
+)
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _color_body(
+    xy: tuple[float, float], brightness: int, transition_ms: Optional[int] = None
+) -> bytes:
+    """Encode a color, brightness and optional transition PUT body."""
+    brightness = max(0, min(254, int(brightness)))
+    percent = (brightness / 254.0) * 100.0
+
+    if transition_ms is None:
+        return _COLOR_BODY % (xy[0], xy[1], percent)
+    return _COLOR_BODY_WITH_DURATION % (
+        xy[0], xy[1], percent, int(max(0, transition_ms))
+    )
+
 
 class BridgeError(Exception):
     """Raised when bridge API calls fail."""
@@ -52,9 +77,16 @@ class BridgeClient:
         self.bridge_ip = bridge_ip
         self.app_key = app_key
         self.timeout = timeout
+        # One pooled keep-alive session per client, so CLIP calls reuse
+        # the TLS connection instead of handshaking per request
         self._session = requests.Session()
         # Hue bridge uses self-signed certificate
         self._session.verify = False
+        self._session.headers["hue-application-key"] = app_key
+
+    def close(self):
+        """Close pooled connections to the bridge."""
+        self._session.close()
 
     def _request(
         self,
@@ -63,6 +95,7 @@ class BridgeClient:
         json_data: Optional[Dict] = None,
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[float] = None,
+        body: Optional[bytes] = None,
     ) -> Dict[str, Any]:
         """Make authenticated request to bridge API.
 
@@ -72,6 +105,7 @@ class BridgeClient:
             json_data: Optional JSON payload
             headers: Optional additional headers
             timeout: Override default timeout
+            body: Optional pre-encoded JSON payload, used instead of json_data
 
         Returns:
             Parsed JSON response
@@ -85,17 +119,17 @@ class BridgeClient:
             raise BridgeConnectionError("Bridge IP not configured")
 
         url = f"https://{self.bridge_ip}/clip/v2{path}"
-
-        request_headers = {"hue-application-key": self.app_key}
-        if headers:
-            request_headers.update(headers)
+        if body is not None:
+            headers = {**_JSON_HEADERS, **headers} if headers else _JSON_HEADERS
 
         try:
+            # The session already carries the application key
             resp = self._session.request(
                 method,
                 url,
-                headers=request_headers,
+                headers=headers,
                 json=json_data,
+                data=body,
                 timeout=timeout or self.timeout,
             )
 
@@ -140,17 +174,10 @@ class BridgeClient:
             return None
 
         try:
-            ctx = ssl.create_default_context()
-            ctx.check_hostname = False
-            ctx.verify_mode = ssl.CERT_NONE
-
-            url = f"https://{self.bridge_ip}/auth/v1"
-            req = urllib.request.Request(url, method="GET")
-            req.add_header("hue-application-key", self.app_key)
-
-            resp = urllib.request.urlopen(req, context=ctx, timeout=self.timeout)
-            headers = dict(resp.headers)
-            return headers.get("hue-application-id")
+            resp = self._session.get(
+                f"https://{self.bridge_ip}/auth/v1", timeout=self.timeout
+            )
+            return resp.headers.get("hue-application-id")
         except Exception:
             return None
 
@@ -186,6 +213,14 @@ class BridgeClient:
         except BridgeError:
             return False
 
+    def _put_body(self, path: str, body: bytes) -> bool:
+        """PUT a pre-encoded JSON body, returning True if successful."""
+        try:
+            self._request("PUT", path, body=body)
+            return True
+        except BridgeError:
+            return False
+
     def set_light_color(
         self,
         light_id: str,
@@ -201,18 +236,8 @@ class BridgeClient:
             brightness: Brightness 0-254
             transition_ms: Optional transition time in milliseconds
         """
-        brightness = max(0, min(254, int(brightness)))
-
-        payload = {
-            "color": {"xy": {"x": xy[0], "y": xy[1]}},
-            "dimming": {"brightness": (brightness / 254.0) * 100.0},
-            "on": {"on": True},
-        }
-
-        if transition_ms is not None:
-            payload["dynamics"] = {"duration": int(max(0, transition_ms))}
-
-        return self.set_light_state(light_id, payload)
+        body = _color_body(xy, brightness, transition_ms)
+        return self._put_body(f"/resource/light/{light_id}", body)
 
     def set_light_gradient(
         self,
@@ -276,15 +301,45 @@ class BridgeClient:
         self, zone_id: str, xy: tuple[float, float], brightness: int
     ) -> bool:
         """Set entire zone color."""
-        brightness = max(0, min(254, int(brightness)))
+        return self._put_body(f"/resource/zone/{zone_id}", _color_body(xy, brightness))
 
-        payload = {
-            "color": {"xy": {"x": xy[0], "y": xy[1]}},
-            "dimming": {"brightness": (brightness / 254.0) * 100.0},
-            "on": {"on": True},
-        }
+    # === Grouped Light Operations ===
+
+    def set_grouped_light_state(self, group_id: str, payload: Dict[str, Any]) -> bool:
+        """Update every light of a room or zone in one request.
+
+        Args:
+            group_id: Grouped light resource ID
+            payload: Hue v2 API payload (on, dimming, color, dynamics)
 
-        return self.set_zone_state(zone_id, payload)
+        Returns:
+            True if successful
+        """
+        try:
+            self._request(
+                "PUT", f"/resource/grouped_light/{group_id}", json_data=payload
+            )
+            return True
+        except BridgeError:
+            return False
+
+    def set_grouped_light_color(
+        self,
+        group_id: str,
+        xy: tuple[float, float],
+        brightness: int,
+        transition_ms: Optional[int] = None,
+    ) -> bool:
+        """Set color and brightness of every light of a room or zone.
+
+        Args:
+            group_id: Grouped light resource ID
+            xy: CIE XY color coordinates (0.0-1.0)
+            brightness: Brightness 0-254
+            transition_ms: Optional transition time in milliseconds
+        """
+        body = _color_body(xy, brightness, transition_ms)
+        return self._put_body(f"/resource/grouped_light/{group_id}", body)
 
     # === Entertainment Operations ===
 
@@ -229,7 +229,7 @@ class ScreenCapture:
             new_w = max(1, int(screen.shape[1] * self.scale_factor))
             if not screen.flags["C_CONTIGUOUS"]:
                 screen = np.ascontiguousarray(screen)
-            screen = np.array(
+            screen = np.asarray(
                 Image.fromarray(screen).resize(
                     (new_w, new_h), Image.Resampling.BILINEAR
                 )
@@ -676,12 +676,14 @@ class ScreenCapture:
 
                 rows = self._extract_pixel_rows(data, width, height, bpp, stride)
 
+                # Channel swaps are strided views over data, which is kept
+                # alive alongside the frame, rather than full-frame copies
                 if fmt == "BGR":
-                    frame = rows.reshape(height, width, 3)[:, :, ::-1].copy()
+                    frame = rows.reshape(height, width, 3)[:, :, ::-1]
                 elif fmt in ("RGBA", "RGBx"):
                     frame = rows.reshape(height, width, 4)
                 elif fmt in ("BGRA", "BGRx"):
-                    frame = rows.reshape(height, width, 4)[:, :, [2, 1, 0, 3]].copy()
+                    frame = rows.reshape(height, width, 4)[:, :, 2::-1]
                 elif fmt in ("BGR15", "RGB15"):
                     arr = np.ascontiguousarray(rows).view(np.uint16).reshape(
                         (height, width)
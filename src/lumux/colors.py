@@ -2,7 +2,7 @@
 
 from typing import Dict, Tuple, Optional
 
-from lumux.utils.rgb_xy_converter import rgb_to_xy
+from lumux.utils.rgb_xy_converter import rgb_to_xy, rgb_to_xy_array
 import numpy as np
 
 
@@ -11,6 +11,10 @@ class ColorAnalyzer:
         self.brightness_scale = brightness_scale
         self.gamma = gamma
         self.previous_colors: Dict[str, Tuple[Tuple[float, float], int]] = {}
+        # Last vectorized batch: (result dict, zone IDs, xy array, brightness)
+        self._last_batch: Optional[tuple] = None
+        # Smoothed state as arrays: (zone IDs, xy array, brightness array)
+        self._smooth_state: Optional[tuple] = None
 
     def analyze_zone(
         self, rgb: Tuple[int, int, int], light_info: Optional[dict] = None
@@ -77,6 +81,12 @@ class ColorAnalyzer:
         if not current:
             return smoothed
 
+        batch = self._last_batch
+        if batch is not None and batch[0] is current:
+            vectorized = self._smooth_batch(batch, factor)
+            if vectorized is not None:
+                return vectorized
+
         for zone_id, curr_value in current.items():
             if zone_id in self.previous_colors:
                 curr_xy, curr_bri = curr_value
@@ -93,6 +103,47 @@ class ColorAnalyzer:
                 smoothed[zone_id] = curr_value
 
         self.previous_colors = smoothed.copy()
+
+        self._smooth_state = None
+        if batch is not None and batch[0] is current:
+            # Seed the array state so following frames take the fast path
+            values = list(smoothed.values())
+            self._smooth_state = (
+                batch[1],
+                np.array([xy for xy, _ in values], dtype=np.float64),
+                np.array([bri for _, bri in values], dtype=np.float64),
+            )
+        return smoothed
+
+    def _smooth_batch(
+        self, batch: tuple, factor: float
+    ) -> Optional[Dict[str, Tuple[Tuple[float, float], int]]]:
+        """apply_smoothing for a frame from _analyze_zones_vectorized.
+
+        Runs the same moving average on whole arrays while the zone layout
+        matches the previous frame.
+
+        Returns:
+            Smoothed zone colors, or None if the dict path must handle it
+        """
+        _, zone_ids, xy, bri = batch
+        state = self._smooth_state
+        if state is not None and state[0] == zone_ids:
+            _, prev_xy, prev_bri = state
+            xy = prev_xy + factor * (xy - prev_xy)
+            # int() truncation, as in the per-zone path
+            bri = np.trunc(prev_bri + factor * (bri - prev_bri))
+        elif self.previous_colors:
+            return None
+
+        self._smooth_state = (zone_ids, xy, bri)
+        smoothed = {
+            zone_id: ((pair[0], pair[1]), b)
+            for zone_id, pair, b in zip(
+                zone_ids, xy.tolist(), bri.astype(np.int64).tolist()
+            )
+        }
+        self.previous_colors = smoothed.copy()
         return smoothed
 
     def analyze_zones_batch(
@@ -109,6 +160,9 @@ class ColorAnalyzer:
         Returns:
             Dictionary mapping zone IDs to ((x, y), brightness)
         """
+        if not light_info_map and zone_colors:
+            return self._analyze_zones_vectorized(zone_colors)
+
         hue_colors = {}
 
         for zone_id, rgb in zone_colors.items():
@@ -119,3 +173,38 @@ class ColorAnalyzer:
             hue_colors[zone_id] = self.analyze_zone(rgb, light_info)
 
         return hue_colors
+
+    def _analyze_zones_vectorized(
+        self, zone_colors: Dict[str, Tuple[int, int, int]]
+    ) -> Dict[str, Tuple[Tuple[float, float], int]]:
+        """Batch equivalent of analyze_zone for zones without gamut info.
+
+        Gamma, xy conversion and brightness run as whole-array NumPy ops
+        instead of per-zone, per-channel Python calls.
+        """
+        zone_ids = list(zone_colors)
+        rgb = np.array([zone_colors[z] for z in zone_ids], dtype=np.float64)
+
+        gamma = self.gamma if self.gamma > 0 else 1.0
+        normalized = np.clip(rgb / 255.0, 0.0, 1.0)
+        corrected = np.rint(normalized**gamma * 255.0)
+
+        xy = rgb_to_xy_array(corrected)
+
+        brightness = (
+            corrected.max(axis=1) / 255.0 * 254.0 * self.brightness_scale
+        ).astype(np.int64)
+        brightness = np.clip(brightness, 1, 254)
+
+        result = {
+            zone_id: ((pair[0], pair[1]), bri)
+            for zone_id, pair, bri in zip(zone_ids, xy.tolist(), brightness.tolist())
+        }
+        # Kept so apply_smoothing can reuse the arrays for this frame
+        self._last_batch = (
+            result,
+            zone_ids,
+            np.asarray(xy, dtype=np.float64),
+            brightness.astype(np.float64),
+        )
+        return result
@@ -1,9 +1,10 @@
 """Settings management for Hue Sync application."""
 
 import json
+from functools import lru_cache
 from dataclasses import dataclass, asdict, field
 from pathlib import Path
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 from lumux.config.zone_mapping import ZoneMapping
 import sys
 import os
@@ -12,6 +13,7 @@ import shlex
 from lumux.utils.logging import timed_print
 
 
+@lru_cache(maxsize=None)
 def is_running_in_flatpak() -> bool:
     """Return True when running inside a Flatpak sandbox."""
     return os.path.exists("/.flatpak-info") or bool(os.environ.get("FLATPAK_ID"))
@@ -47,6 +49,8 @@ class SyncSettings:
     brightness_scale: float = 1.0
     gamma: float = 1.0
     smoothing_factor: float = 0.3
+    # Record per-stage frame timings in the sync stats
+    debug_timings: bool = False
 
 
 @dataclass
@@ -101,6 +105,10 @@ class SettingsManager:
         self._settings = Settings()
         self._config_dir = self._get_config_dir()
         self._settings_file = self._config_dir / "settings.json"
+        # Autostart state, probed once and then tracked by enable/disable
+        self._autostart_enabled: Optional[bool] = None
+        # JSON last written by save(); identical saves skip the disk write
+        self._last_saved_json: Optional[str] = None
         self._load_settings()
 
     def _get_config_dir(self) -> Path:
@@ -209,8 +217,31 @@ class SettingsManager:
             "reading_mode": asdict(self._settings.reading_mode),
         }
 
+        serialized = json.dumps(data, indent=2)
+        if serialized == self._last_saved_json:
+            return
+
         with open(self._settings_file, "w") as f:
-            json.dump(data, f, indent=2)
+            f.write(serialized)
+        self._last_saved_json = serialized
+
+    def update(self, values: Dict[str, Dict[str, Any]]) -> None:
+        """Apply several settings in one call.
+
+        Args:
+            values: Mapping of section name (e.g. ``"hue"``) to a mapping of
+                field names and new values
+        """
+        for section_name, fields in values.items():
+            section = getattr(self._settings, section_name, None)
+            if section is None:
+                timed_print(f"Unknown settings section: {section_name}")
+                continue
+            for name, value in fields.items():
+                if not hasattr(section, name):
+                    timed_print(f"Unknown setting: {section_name}.{name}")
+                    continue
+                setattr(section, name, value)
 
     def _validate_settings(self):
         """Validate and clamp settings to valid ranges."""
@@ -286,7 +317,10 @@ class SettingsManager:
 
     def enable_autostart(self):
         """Enable autostart by creating .desktop file in autostart directory."""
-        return self._enable_autostart_file()
+        result = self._enable_autostart_file()
+        # Unknown again if writing failed; re-probe on next query
+        self._autostart_enabled = True if result else None
+        return result
 
     def _get_autostart_path(self) -> Path:
         """Get the autostart .desktop file path, respecting Flatpak sandbox."""
@@ -356,7 +390,10 @@ NoDisplay=false
 
     def disable_autostart(self):
         """Disable autostart by removing .desktop file."""
-        return self._disable_autostart_file()
+        result = self._disable_autostart_file()
+        # Unknown again if removal failed; re-probe on next query
+        self._autostart_enabled = False if result else None
+        return result
 
     def _disable_autostart_file(self) -> bool:
         """Disable autostart by removing .desktop file."""
@@ -370,8 +407,14 @@ NoDisplay=false
             return False
 
     def is_autostart_enabled(self) -> bool:
-        """Check if autostart is enabled by looking for .desktop file."""
-        return self._get_autostart_path().exists()
+        """Check if autostart is enabled by looking for .desktop file.
+
+        The file is stat'ed once; afterwards the cached state is kept in sync
+        by enable_autostart()/disable_autostart().
+        """
+        if self._autostart_enabled is None:
+            self._autostart_enabled = self._get_autostart_path().exists()
+        return self._autostart_enabled
 
     def get_autostart_status(self) -> tuple[bool, str]:
         """Get autostart status and a message explaining the current state.
@@ -8,11 +8,17 @@ Public widgets:
     TrayIcon — system tray integration
 """
 
-from lumux.gui.main_window import MainWindow
-from lumux.gui.settings_dialog import SettingsDialog
-from lumux.gui.bridge_wizard import BridgeWizard
-from lumux.gui.zone_preview_widget import ZonePreviewWidget
-from lumux.gui.tray_icon import TrayIcon
+import importlib
+
+# Widgets are resolved on first access so importing one GUI module does not
+# pull in every other one (e.g. the bridge wizard and its discovery code).
+_EXPORTS = {
+    "MainWindow": "lumux.gui.main_window",
+    "SettingsDialog": "lumux.gui.settings_dialog",
+    "BridgeWizard": "lumux.gui.bridge_wizard",
+    "ZonePreviewWidget": "lumux.gui.zone_preview_widget",
+    "TrayIcon": "lumux.gui.tray_icon",
+}
 
 __all__ = [
     "MainWindow",
@@ -21,3 +27,12 @@ __all__ = [
     "ZonePreviewWidget",
     "TrayIcon",
 ]
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
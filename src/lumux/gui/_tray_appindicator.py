@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""AppIndicator tray icon process for Lumux.
+
+Fallback for systems without StatusNotifierItem support. Runs in its own
+process because AppIndicator requires GTK3, which cannot share a process
+with the GTK4 app.
+
+Usage: _tray_appindicator.py CMD_FD EVENT_FD INDICATOR_TYPE ICON
+
+INDICATOR_TYPE is 'ayatana' or 'appindicator'; ICON is an icon file path
+or themed icon name.
+"""
+
+import os
+import sys
+
+import gi
+
+gi.require_version("Gtk", "3.0")
+if sys.argv[3] == "ayatana":
+    gi.require_version("AyatanaAppIndicator3", "0.1")
+    from gi.repository import AyatanaAppIndicator3 as AppIndicator
+else:
+    gi.require_version("AppIndicator3", "0.1")
+    from gi.repository import AppIndicator3 as AppIndicator
+
+from gi.repository import Gtk, GLib
+
+from _tray_protocol import (
+    EVENT_FRAMES,
+    FRAME,
+    OP_QUIT,
+    OP_SETTINGS,
+    OP_SHOW,
+    OP_TOGGLE,
+    OP_UPDATE_SYNC,
+    READ_SIZE,
+)
+
+
+class TrayApp:
+    def __init__(self, cmd_fd, event_fd, icon):
+        self.event_fd = event_fd
+        self.is_syncing = False
+        self.ind = AppIndicator.Indicator.new(
+            "io.github.enginkirmaci.lumux",
+            icon,
+            AppIndicator.IndicatorCategory.APPLICATION_STATUS,
+        )
+        self.ind.set_status(AppIndicator.IndicatorStatus.ACTIVE)
+        self.ind.set_title("Lumux - Hue Screen Sync")
+        self.menu = Gtk.Menu()
+
+        def add(lbl, cb=None):
+            i = Gtk.MenuItem(label=lbl)
+            if cb:
+                i.connect("activate", cb)
+            self.menu.append(i)
+            return i
+
+        add("Show Lumux", lambda w: self.send(OP_SHOW))
+        self.menu.append(Gtk.SeparatorMenuItem())
+        self.sync_item = add("Start Sync", lambda w: self.send(OP_TOGGLE))
+        self.menu.append(Gtk.SeparatorMenuItem())
+        add("Settings", lambda w: self.send(OP_SETTINGS))
+        self.menu.append(Gtk.SeparatorMenuItem())
+        add("Quit", lambda w: (self.send(OP_QUIT), Gtk.main_quit()))
+
+        self.menu.show_all()
+        self.ind.set_menu(self.menu)
+        GLib.unix_fd_add_full(
+            GLib.PRIORITY_DEFAULT,
+            cmd_fd,
+            GLib.IOCondition.IN | GLib.IOCondition.HUP,
+            self.on_cmd,
+        )
+
+    def on_cmd(self, fd, cond):
+        try:
+            data = os.read(fd, READ_SIZE)
+        except OSError:
+            data = b""
+        if not data:
+            Gtk.main_quit()
+            return False
+        for op, arg in FRAME.iter_unpack(data):
+            self.handle(op, arg)
+        return True
+
+    def handle(self, op, arg):
+        if op == OP_QUIT:
+            Gtk.main_quit()
+        elif op == OP_UPDATE_SYNC:
+            self.is_syncing = bool(arg)
+            self.sync_item.set_label("Stop Sync" if self.is_syncing else "Start Sync")
+
+    def send(self, op):
+        os.write(self.event_fd, EVENT_FRAMES[op])
+
+
+if __name__ == "__main__":
+    TrayApp(int(sys.argv[1]), int(sys.argv[2]), sys.argv[4])
+    Gtk.main()
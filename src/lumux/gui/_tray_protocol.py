@@ -0,0 +1,33 @@
+"""Wire protocol between Lumux and its tray icon process.
+
+Every message is a fixed (opcode, argument) frame. Frames are written
+whole and are far below PIPE_BUF, so a read never splits one.
+
+This module is imported by the tray scripts as a sibling file, so it must
+only depend on the standard library.
+"""
+
+import struct
+
+# Tray to app
+OP_SHOW = 0x01
+OP_TOGGLE = 0x02
+OP_SETTINGS = 0x03
+
+# Both directions
+OP_QUIT = 0x04
+
+# App to tray; the argument is 1 while syncing, else 0
+OP_UPDATE_SYNC = 0x10
+
+FRAME = struct.Struct("<BB")
+
+# Every frame ever sent, prebuilt so senders write constant bytes
+EVENT_FRAMES = {
+    op: FRAME.pack(op, 0) for op in (OP_SHOW, OP_TOGGLE, OP_SETTINGS, OP_QUIT)
+}
+QUIT_FRAME = EVENT_FRAMES[OP_QUIT]
+SYNC_FRAMES = (FRAME.pack(OP_UPDATE_SYNC, 0), FRAME.pack(OP_UPDATE_SYNC, 1))
+
+# Bytes to request per read, a whole number of frames
+READ_SIZE = FRAME.size * 32
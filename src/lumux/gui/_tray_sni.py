@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""StatusNotifierItem tray icon process for Lumux.
+
+Implements the org.kde.StatusNotifierItem and com.canonical.dbusmenu D-Bus
+interfaces directly, providing cross-desktop tray support without GTK3.
+
+Usage: _tray_sni.py CMD_FD EVENT_FD PIXMAP [WATCHER...]
+
+PIXMAP is the icon pre-rendered by the app as "WIDTH:HEIGHT:ARGB-HEX", or
+empty to let hosts use the themed icon name. WATCHERS are the
+StatusNotifierWatcher names to try registering with, in order.
+"""
+
+import os
+import sys
+
+from gi.repository import GLib
+from pydbus import SessionBus
+from pydbus.generic import signal
+
+from _tray_protocol import (
+    EVENT_FRAMES,
+    FRAME,
+    OP_QUIT,
+    OP_SETTINGS,
+    OP_SHOW,
+    OP_TOGGLE,
+    OP_UPDATE_SYNC,
+    READ_SIZE,
+)
+
+APP_ID = "io.github.enginkirmaci.lumux"
+BUS_NAME = "io.github.enginkirmaci.lumux.Tray"
+
+SNI_INTERFACE = """<node><interface name="org.kde.StatusNotifierItem"><property name="Category" type="s" access="read"/><property name="Id" type="s" access="read"/><property name="Title" type="s" access="read"/><property name="Status" type="s" access="read"/><property name="IconName" type="s" access="read"/><property name="IconPixmap" type="a(iiay)" access="read"/><property name="AttentionIconName" type="s" access="read"/><property name="AttentionIconPixmap" type="a(iiay)" access="read"/><property name="ToolTip" type="(sa(iiay)ss)" access="read"/><property name="ItemIsMenu" type="b" access="read"/><property name="Menu" type="o" access="read"/><method name="ContextMenu"><arg name="x" type="i" direction="in"/><arg name="y" type="i" direction="in"/></method><method name="Activate"><arg name="x" type="i" direction="in"/><arg name="y" type="i" direction="in"/></method><method name="SecondaryActivate"><arg name="x" type="i" direction="in"/><arg name="y" type="i" direction="in"/></method><method name="Scroll"><arg name="delta" type="i" direction="in"/><arg name="orientation" type="s" direction="in"/></method><signal name="NewTitle"/><signal name="NewIcon"/><signal name="NewAttentionIcon"/><signal name="NewOverlayIcon"/><signal name="NewToolTip"/><signal name="NewStatus"><arg name="status" type="s"/></signal></interface></node>"""
+
+DBUSMENU_INTERFACE = """<node><interface name="com.canonical.dbusmenu"><property name="Version" type="u" access="read"/><property name="TextDirection" type="s" access="read"/><property name="Status" type="s" access="read"/><property name="IconThemePath" type="as" access="read"/><method name="GetLayout"><arg name="parentId" type="i" direction="in"/><arg name="recursionDepth" type="i" direction="in"/><arg name="propertyNames" type="as" direction="in"/><arg name="revision" type="u" direction="out"/><arg name="layout" type="(ia{sv}av)" direction="out"/></method><method name="GetGroupProperties"><arg name="ids" type="ai" direction="in"/><arg name="propertyNames" type="as" direction="in"/><arg name="properties" type="a(ia{sv})" direction="out"/></method><method name="GetProperty"><arg name="id" type="i" direction="in"/><arg name="name" type="s" direction="in"/><arg name="value" type="v" direction="out"/></method><method name="Event"><arg name="id" type="i" direction="in"/><arg name="eventId" type="s" direction="in"/><arg name="data" type="v" direction="in"/><arg name="timestamp" type="u" direction="in"/></method><method name="EventGroup"><arg name="events" type="a(isvu)" direction="in"/><arg name="idErrors" type="ai" direction="out"/></method><method name="AboutToShow"><arg name="id" type="i" direction="in"/><arg name="needUpdate" type="b" direction="out"/></method><method name="AboutToShowGroup"><arg name="ids" type="ai" direction="in"/><arg name="updatesNeeded" type="ai" direction="out"/><arg name="idErrors" type="ai" direction="out"/></method><signal name="ItemsPropertiesUpdated"><arg name="updatedProps" type="a(ia{sv})"/><arg name="removedProps" type="a(ias)"/></signal><signal name="LayoutUpdated"><arg name="revision" type="u"/><arg name="parent" type="i"/></signal><signal name="ItemActivationRequested"><arg name="id" type="i"/><arg name="timestamp" type="u"/></signal></interface></node>"""
+
+
+class DBusMenu:
+    dbus = DBUSMENU_INTERFACE
+    Version, TextDirection, Status, IconThemePath = 3, "ltr", "normal", []
+
+    def __init__(self, on_click):
+        self.on_click, self.is_syncing, self._revision = on_click, False, 1
+        self._emit_pending, self._emitted_syncing = False, False
+        # Only item 3's label depends on state, so both menus are built once
+        sep = {"type": GLib.Variant("s", "separator")}
+        visible = GLib.Variant("b", True)
+        self._props, self._layouts = {}, {}
+        for syncing in (False, True):
+            sync_label = "Stop Sync" if syncing else "Start Sync"
+            props = {
+                1: {"label": GLib.Variant("s", "Show Lumux")},
+                2: sep,
+                3: {"label": GLib.Variant("s", sync_label)},
+                4: sep,
+                5: {"label": GLib.Variant("s", "Settings")},
+                6: sep,
+                7: {"label": GLib.Variant("s", "Quit")},
+            }
+            children = [
+                GLib.Variant("(ia{sv}av)", (id, {**p, "visible": visible}, []))
+                for id, p in props.items()
+            ]
+            self._props[syncing] = props
+            self._layouts[syncing] = (
+                0,
+                {"children-display": GLib.Variant("s", "submenu")},
+                children,
+            )
+
+    def GetLayout(self, pId, depth, props):
+        return (self._revision, self._layouts[self.is_syncing])
+
+    def GetGroupProperties(self, ids, props):
+        by_id = self._props[self.is_syncing]
+        return [(id, by_id.get(id, {})) for id in ids]
+
+    def GetProperty(self, id, name):
+        return GLib.Variant("s", "")
+
+    def Event(self, id, eid, data, ts):
+        if eid == "clicked":
+            self.on_click(id)
+
+    def EventGroup(self, evs):
+        for e in evs:
+            if e[1] == "clicked":
+                self.on_click(e[0])
+        return []
+
+    def AboutToShow(self, id):
+        return False
+
+    def AboutToShowGroup(self, ids):
+        return ([], [])
+
+    def update_sync(self, syncing):
+        # Coalesce a burst of updates into one signal on the next idle pass
+        self.is_syncing = syncing
+        if not self._emit_pending:
+            self._emit_pending = True
+            GLib.idle_add(self._emit_sync)
+
+    def _emit_sync(self):
+        # Only a label changes, so signal that item instead of a new layout
+        self._emit_pending = False
+        if self.is_syncing != self._emitted_syncing:
+            self._emitted_syncing = self.is_syncing
+            self.ItemsPropertiesUpdated.emit(
+                [(3, self._props[self.is_syncing][3])], []
+            )
+        return False
+
+    ItemsPropertiesUpdated = signal()
+    LayoutUpdated = signal()
+    ItemActivationRequested = signal()
+
+
+class StatusNotifierItem:
+    dbus = SNI_INTERFACE
+    Category, Id, Title = "ApplicationStatus", APP_ID, "Lumux - Hue Screen Sync"
+    ItemIsMenu, Menu = False, "/MenuBar"
+
+    def __init__(self, menu, send, icon_pixmap):
+        self.menu, self.send = menu, send
+        self._status = "Active"
+        self._icon_pixmap = icon_pixmap
+
+    @property
+    def Status(self):
+        return self._status
+
+    @property
+    def IconName(self):
+        return APP_ID
+
+    @property
+    def IconPixmap(self):
+        return self._icon_pixmap
+
+    @property
+    def AttentionIconName(self):
+        return APP_ID
+
+    @property
+    def AttentionIconPixmap(self):
+        return self._icon_pixmap
+
+    @property
+    def ToolTip(self):
+        return (APP_ID, self._icon_pixmap, "Lumux", "Hue Screen Sync")
+
+    def ContextMenu(self, x, y):
+        pass
+
+    def Activate(self, x, y):
+        self.send(OP_SHOW)
+
+    def SecondaryActivate(self, x, y):
+        self.send(OP_TOGGLE)
+
+    def Scroll(self, d, o):
+        pass
+
+    NewTitle = signal()
+    NewIcon = signal()
+    NewAttentionIcon = signal()
+    NewOverlayIcon = signal()
+    NewToolTip = signal()
+    NewStatus = signal()
+
+
+def parse_pixmap(arg):
+    """Decode the PIXMAP argument into an IconPixmap value."""
+    if not arg:
+        return []
+    width, height, argb = arg.split(":")
+    return [(int(width), int(height), GLib.Variant("ay", bytes.fromhex(argb)))]
+
+
+class TrayApp:
+    def __init__(self, cmd_fd, event_fd, icon_pixmap, watchers):
+        self.event_fd = event_fd
+        self.loop = GLib.MainLoop()
+        self.bus = SessionBus()
+        self.menu = DBusMenu(self.on_click)
+        self.sni = StatusNotifierItem(self.menu, self.send, icon_pixmap)
+        try:
+            self.bus.publish(
+                BUS_NAME, ("/StatusNotifierItem", self.sni), ("/MenuBar", self.menu)
+            )
+        except Exception:
+            sys.exit(1)
+
+        for w in watchers:
+            try:
+                watcher = self.bus.get(w, "/StatusNotifierWatcher")
+                watcher.RegisterStatusNotifierItem(BUS_NAME)
+                break
+            except Exception:
+                pass
+
+        GLib.unix_fd_add_full(
+            GLib.PRIORITY_DEFAULT,
+            cmd_fd,
+            GLib.IOCondition.IN | GLib.IOCondition.HUP,
+            self.on_cmd,
+        )
+
+    def on_click(self, id):
+        acts = {1: OP_SHOW, 3: OP_TOGGLE, 5: OP_SETTINGS, 7: OP_QUIT}
+        if id in acts:
+            self.send(acts[id])
+            if id == 7:
+                self.loop.quit()
+
+    def on_cmd(self, fd, cond):
+        try:
+            data = os.read(fd, READ_SIZE)
+        except OSError:
+            data = b""
+        if not data:
+            self.loop.quit()
+            return False
+        for op, arg in FRAME.iter_unpack(data):
+            self.handle(op, arg)
+        return True
+
+    def handle(self, op, arg):
+        if op == OP_QUIT:
+            self.loop.quit()
+        elif op == OP_UPDATE_SYNC:
+            self.menu.update_sync(bool(arg))
+
+    def send(self, op):
+        os.write(self.event_fd, EVENT_FRAMES[op])
+
+    def run(self):
+        self.loop.run()
+
+
+if __name__ == "__main__":
+    try:
+        TrayApp(
+            int(sys.argv[1]),
+            int(sys.argv[2]),
+            parse_pixmap(sys.argv[3]),
+            sys.argv[4:],
+        ).run()
+    except Exception:
+        sys.exit(1)
@@ -40,8 +40,11 @@ class MainWindow(Adw.ApplicationWindow):
         # System tray icon
         self._tray_icon = None
 
+        # Settings dialog is built once and re-presented on later opens
+        self._settings_dialog = None
+
         # Brightness slider debounce timer
-        self._brightness_timeout_id = None
+        self._reading_apply_timeout_id = None
 
         self._quitting = False
 
@@ -91,11 +94,15 @@ class MainWindow(Adw.ApplicationWindow):
     def _on_window_minimized(self, window, pspec):
         """When the window manager minimizes the window, hide to tray instead."""
         if window.props.minimized and not self._minimized_by_us:
-            if self._tray_icon:
+            if self._has_tray():
                 self._minimized_by_us = True
                 self.hide()
                 GLib.idle_add(self._reset_minimized_flag)
 
+    def _has_tray(self) -> bool:
+        """Whether a live tray icon can bring back a hidden window."""
+        return self._tray_icon is not None and self._tray_icon.is_available
+
     def _reset_minimized_flag(self):
         self._minimized_by_us = False
         return False
@@ -595,8 +602,8 @@ class MainWindow(Adw.ApplicationWindow):
             self._switch_to_video_mode()
 
     def _on_color_changed(self, button, param):
-        """Handle color picker change - auto-apply."""
-        self._apply_reading_settings()
+        """Handle color picker change - debounced auto-apply."""
+        self._schedule_reading_apply()
 
     def _on_brightness_changed(self, scale):
         """Handle brightness slider change - debounced auto-apply."""
@@ -604,14 +611,22 @@ class MainWindow(Adw.ApplicationWindow):
         if hasattr(self, "brightness_value_label"):
             self.brightness_value_label.set_text(str(int(scale.get_value())))
 
+        self._schedule_reading_apply()
+
+    def _schedule_reading_apply(self):
+        """Apply reading settings once changes settle.
+
+        Each apply is a PUT per zone light, and the bridge only takes about
+        10 light commands per second, so bursts are coalesced.
+        """
         # Debounce: cancel existing timer and start new one
-        if self._brightness_timeout_id:
-            GLib.source_remove(self._brightness_timeout_id)
-            self._brightness_timeout_id = None
+        if self._reading_apply_timeout_id:
+            GLib.source_remove(self._reading_apply_timeout_id)
+            self._reading_apply_timeout_id = None
 
         # Schedule apply after 150ms of no changes (user released slider)
-        self._brightness_timeout_id = GLib.timeout_add(
-            150, self._on_brightness_change_done
+        self._reading_apply_timeout_id = GLib.timeout_add(
+            150, self._on_reading_change_done
         )
 
     def _on_preset_clicked(self, button, preset_id: str, hex_color: str):
@@ -631,9 +646,9 @@ class MainWindow(Adw.ApplicationWindow):
         # Auto-apply the preset
         self._apply_reading_settings()
 
-    def _on_brightness_change_done(self):
-        """Called when brightness slider change is complete (debounced)."""
-        self._brightness_timeout_id = None
+    def _on_reading_change_done(self):
+        """Called when color or brightness changes are complete (debounced)."""
+        self._reading_apply_timeout_id = None
         self._apply_reading_settings()
         return False  # Don't repeat
 
@@ -744,13 +759,8 @@ class MainWindow(Adw.ApplicationWindow):
 
     def _update_status(self) -> bool:
         """Check for status updates from sync thread."""
-        # Drain the queue to get the latest status
-        last_status = None
-        while True:
-            status = self.sync_controller.get_status()
-            if status is None:
-                break
-            last_status = status
+        # Only the latest status is kept, so one take is enough
+        last_status = self.sync_controller.get_status()
 
         if last_status:
             status_type, message = last_status[:2]
@@ -804,7 +814,7 @@ class MainWindow(Adw.ApplicationWindow):
             self.status_subtitle.set_text("Connecting entertainment streaming")
             self._update_status_card("syncing")
             # Optionally minimize to tray when sync begins
-            if self._should_minimize_to_tray():
+            if self._should_minimize_to_tray() and self._has_tray():
                 self.hide()
         else:
             self.status_label.set_text("Connection Failed")
@@ -839,9 +849,12 @@ class MainWindow(Adw.ApplicationWindow):
 
     def _on_settings_clicked(self, button):
         """Open settings dialog."""
-        dialog = SettingsDialog(self, self.app_context)
-        dialog.connect("closed", self._on_settings_closed)
-        dialog.present(self)
+        if self._settings_dialog is None:
+            self._settings_dialog = SettingsDialog(self, self.app_context)
+            self._settings_dialog.connect("closed", self._on_settings_closed)
+        else:
+            self._settings_dialog.refresh()
+        self._settings_dialog.present(self)
 
     def _on_settings_closed(self, dialog=None):
         """Handle settings dialog close - refresh configuration."""
@@ -860,7 +873,7 @@ class MainWindow(Adw.ApplicationWindow):
 
     def do_close_request(self) -> bool:
         """Handle window close request - minimize to tray if available, otherwise quit."""
-        if self._tray_icon and not self._quitting:
+        if self._has_tray() and not self._quitting:
             self.hide()
             return True
 
@@ -873,9 +886,9 @@ class MainWindow(Adw.ApplicationWindow):
             GLib.source_remove(self.status_timeout_id)
             self.status_timeout_id = None
 
-        if self._brightness_timeout_id:
-            GLib.source_remove(self._brightness_timeout_id)
-            self._brightness_timeout_id = None
+        if self._reading_apply_timeout_id:
+            GLib.source_remove(self._reading_apply_timeout_id)
+            self._reading_apply_timeout_id = None
 
         if self._tray_icon:
             self._tray_icon.destroy()
@@ -1,14 +1,189 @@
 """Settings dialog with modern Adwaita preferences styling."""
 
+import operator
+import threading
+
 import gi
 
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
-from gi.repository import Gtk, Adw, Gdk
+from gi.repository import Gtk, Adw, Gdk, Gio, GLib
 from lumux.hue_bridge import HueBridge
 from lumux.app_context import AppContext
 from lumux.utils.rgb_xy_converter import xy_to_rgb, rgb_to_xy
-from lumux.gui.bridge_wizard import BridgeWizard
+
+# Bridge credential rows as (attribute, title, settings path, secret)
+_CONNECTION_ROWS = (
+    ("ip_row", "Bridge IP Address", "hue.bridge_ip", False),
+    ("key_row", "App Key", "hue.app_key", True),
+    ("client_key_row", "Client Key", "hue.client_key", True),
+)
+
+# Settings-backed rows as (attribute, title, subtitle, settings path,
+# spin range). Spin range is (lower, upper, step, digits); None builds a
+# switch row instead.
+_GENERAL_ROWS = (
+    (
+        "minimize_row",
+        "Minimize to Tray on Sync",
+        "Automatically minimize the main window when sync starts",
+        "ui.minimize_to_tray_on_sync",
+        None,
+    ),
+    (
+        "minimize_startup_row",
+        "Minimize at Startup",
+        "Start Lumux minimized to system tray",
+        "ui.minimize_at_startup",
+        None,
+    ),
+)
+
+_CAPTURE_ROWS = (
+    (
+        "scale_row",
+        "Resolution Scale",
+        "Lower values improve performance",
+        "capture.scale_factor",
+        (0.01, 1.0, 0.01, 2),
+    ),
+)
+
+_BLACKBAR_ROWS = (
+    (
+        "blackbar_enable_row",
+        "Enable Detection",
+        "Ignore black bars around video content",
+        "black_bar.enabled",
+        None,
+    ),
+    (
+        "blackbar_threshold_row",
+        "Luminance Threshold",
+        "Brightness level considered black (0-50)",
+        "black_bar.threshold",
+        (0, 50, 1, 0),
+    ),
+    (
+        "blackbar_rate_row",
+        "Detection Rate",
+        "Run detection every N frames (1-120)",
+        "black_bar.detection_rate",
+        (1, 120, 1, 0),
+    ),
+)
+
+_ZONE_ROWS = (
+    (
+        "preview_row",
+        "Show Zone Preview",
+        "Display real-time zone visualization",
+        "zones.show_preview",
+        None,
+    ),
+    (
+        "rows_row",
+        "Edge Rows",
+        "Number of zones along left/right edges",
+        "zones.rows",
+        (1, 64, 1, 0),
+    ),
+    (
+        "cols_row",
+        "Edge Columns",
+        "Number of zones along top/bottom edges",
+        "zones.cols",
+        (1, 64, 1, 0),
+    ),
+)
+
+_SYNC_ROWS = (
+    (
+        "fps_row",
+        "Target FPS",
+        "Frames per second for sync updates",
+        "sync.fps",
+        (1, 60, 1, 0),
+    ),
+    (
+        "transition_row",
+        "Transition Time",
+        "Milliseconds for color transitions",
+        "sync.transition_time_ms",
+        (0, 1000, 50, 0),
+    ),
+)
+
+_COLOR_ROWS = (
+    (
+        "brightness_row",
+        "Brightness Scale",
+        "Multiply light brightness",
+        "sync.brightness_scale",
+        (0.0, 2.0, 0.1, 1),
+    ),
+    (
+        "gamma_row",
+        "Gamma",
+        "Gamma correction for colors",
+        "sync.gamma",
+        (0.1, 3.0, 0.1, 2),
+    ),
+    (
+        "smoothing_row",
+        "Smoothing Factor",
+        "Smooth color transitions",
+        "sync.smoothing_factor",
+        (0.1, 1.0, 0.1, 1),
+    ),
+)
+
+_READING_ROWS = (
+    (
+        "reading_brightness_row",
+        "Default Brightness",
+        "Brightness level for reading mode (0-254)",
+        "reading_mode.brightness",
+        (0, 254, 1, 0),
+    ),
+    (
+        "reading_auto_row",
+        "Auto-activate on Stop",
+        "Automatically switch to reading mode when video sync stops",
+        "reading_mode.auto_activate",
+        None,
+    ),
+    (
+        "reading_auto_startup_row",
+        "Auto-activate on Startup",
+        "Automatically switch to reading mode when app starts",
+        "reading_mode.auto_activate_on_startup",
+        None,
+    ),
+)
+
+
+# Command that grants the Flatpak sandbox access needed for autostart
+_FLATPAK_OVERRIDE_COMMAND = (
+    "flatpak override --user --filesystem=host io.github.enginkirmaci.lumux"
+)
+
+_color_dialog = None
+
+
+def _get_color_dialog() -> Gtk.ColorDialog:
+    """Return the reading color picker, shared by every dialog instance."""
+    global _color_dialog
+    if _color_dialog is None:
+        _color_dialog = Gtk.ColorDialog(title="Select Default Reading Color")
+    return _color_dialog
+
+
+def _set_by_path(obj, path: str, value) -> None:
+    """Assign a dotted attribute path such as ``"sync.fps"`` on obj."""
+    parent, _, name = path.rpartition(".")
+    target = operator.attrgetter(parent)(obj) if parent else obj
+    setattr(target, name, value)
 
 
 class SettingsDialog(Adw.PreferencesDialog):
@@ -19,6 +194,13 @@ class SettingsDialog(Adw.PreferencesDialog):
         self.bridge = app_context.bridge
         self.discovered_bridges = []
         self._parent = parent
+        # Cancels an in-flight entertainment zone load (refresh or close)
+        self._ent_cancellable = None
+        # (row, settings path, getter) for every table-built row
+        self._setting_rows = []
+        self._entry_rows = []
+        # Built on first use by _show_flatpak_permission_dialog
+        self._flatpak_dialog = None
 
         self.set_title("Settings")
         self.set_search_enabled(True)
@@ -27,360 +209,316 @@ class SettingsDialog(Adw.PreferencesDialog):
 
     def _build_ui(self):
         # Bridge page
-        bridge_page = Adw.PreferencesPage()
-        bridge_page.set_title("Bridge")
-        bridge_page.set_icon_name("network-server-symbolic")
-        self.add(bridge_page)
+        bridge_page = self._add_page("Bridge", "network-server-symbolic")
 
         # Status group (moved to top)
-        status_group = Adw.PreferencesGroup()
-        status_group.set_title("Connection Status")
-        bridge_page.add(status_group)
-
-        self.status_row = Adw.ActionRow()
-        self.status_row.set_title("Status")
-        self.status_row.set_subtitle("Not connected")
-        self.status_icon = Gtk.Image.new_from_icon_name("network-offline-symbolic")
+        status_group = self._add_group(bridge_page, "Connection Status")
+
+        self.status_row = Adw.ActionRow(title="Status", subtitle="Not connected")
+        self.status_icon = Gtk.Image(icon_name="network-offline-symbolic")
         self.status_row.add_prefix(self.status_icon)
+
+        test_btn = Gtk.Button(
+            label="Test",
+            tooltip_text="Test connection to the bridge",
+            css_classes=["flat"],
+            valign=Gtk.Align.CENTER,
+        )
+        test_btn.connect("clicked", self._on_test_connection)
+        self.status_row.add_suffix(test_btn)
         status_group.add(self.status_row)
 
+        # Quick, non-connecting check first so the dialog paints without
+        # waiting on the bridge; a connect attempt follows if it is needed
+        self._connect_after_status = True
         self._update_bridge_status()
 
         # Connection group
-        connection_group = Adw.PreferencesGroup()
-        connection_group.set_title("Connection")
-        connection_group.set_description("Configure your Philips Hue bridge connection")
-        bridge_page.add(connection_group)
-
-        # Bridge IP row
-        self.ip_row = Adw.EntryRow()
-        self.ip_row.set_title("Bridge IP Address")
-        self.ip_row.set_text(self.settings.hue.bridge_ip)
-        self.ip_row.set_show_apply_button(False)
-        connection_group.add(self.ip_row)
-
-        # App Key row (password)
-        self.key_row = Adw.PasswordEntryRow()
-        self.key_row.set_title("App Key")
-        self.key_row.set_text(self.settings.hue.app_key)
-        connection_group.add(self.key_row)
-
-        # Client Key row (password)
-        self.client_key_row = Adw.PasswordEntryRow()
-        self.client_key_row.set_title("Client Key")
-        self.client_key_row.set_text(self.settings.hue.client_key)
-        connection_group.add(self.client_key_row)
+        connection_group = self._add_group(
+            bridge_page, "Connection", "Configure your Philips Hue bridge connection"
+        )
+
+        # Bridge IP, App Key and Client Key rows
+        self._add_entry_rows(connection_group, _CONNECTION_ROWS)
+        self._load_entry_rows()
 
         # Wizard setup row
-        wizard_row = Adw.ActionRow()
-        wizard_row.set_title("Bridge Setup")
-        wizard_row.set_subtitle("Launch wizard to discover and configure bridge")
+        wizard_row = Adw.ActionRow(
+            title="Bridge Setup",
+            subtitle="Launch wizard to discover and configure bridge",
+        )
 
-        wizard_btn = Gtk.Button(label="Setup Bridge")
-        wizard_btn.add_css_class("suggested-action")
-        wizard_btn.set_valign(Gtk.Align.CENTER)
+        wizard_btn = Gtk.Button(
+            label="Setup Bridge",
+            css_classes=["suggested-action"],
+            valign=Gtk.Align.CENTER,
+        )
         wizard_btn.connect("clicked", self._on_start_wizard)
         wizard_row.add_suffix(wizard_btn)
         connection_group.add(wizard_row)
 
         # Entertainment group
-        ent_group = Adw.PreferencesGroup()
-        ent_group.set_title("Entertainment Zone")
-        ent_group.set_description("Select an entertainment zone for streaming")
-        bridge_page.add(ent_group)
+        ent_group = self._add_group(
+            bridge_page,
+            "Entertainment Zone",
+            "Select an entertainment zone for streaming",
+        )
 
         # Entertainment zone combo
-        self.ent_row = Adw.ComboRow()
-        self.ent_row.set_title("Entertainment Zone")
-        self.ent_row.set_subtitle("Zone used for light control")
+        # The model is spliced in place on reload rather than replaced
+        self._ent_model = Gtk.StringList.new([])
+        self.ent_row = Adw.ComboRow(
+            title="Entertainment Zone",
+            subtitle="Zone used for light control",
+            model=self._ent_model,
+        )
         self._entertainment_configs = []
         self._load_entertainment_configs()
         ent_group.add(self.ent_row)
 
         # Refresh button
-        refresh_row = Adw.ActionRow()
-        refresh_row.set_title("Refresh Zones")
-        refresh_row.set_subtitle("Reload entertainment zones from bridge")
-        refresh_btn = Gtk.Button()
-        refresh_btn.set_icon_name("view-refresh-symbolic")
-        refresh_btn.add_css_class("flat")
-        refresh_btn.set_valign(Gtk.Align.CENTER)
+        refresh_row = Adw.ActionRow(
+            title="Refresh Zones",
+            subtitle="Reload entertainment zones from bridge",
+        )
+        refresh_btn = Gtk.Button(
+            icon_name="view-refresh-symbolic",
+            css_classes=["flat"],
+            valign=Gtk.Align.CENTER,
+        )
         refresh_btn.connect("clicked", self._on_refresh_entertainment_configs)
         refresh_row.add_suffix(refresh_btn)
         refresh_row.set_activatable_widget(refresh_btn)
         ent_group.add(refresh_row)
 
         # General / Application page
-        general_page = Adw.PreferencesPage()
-        general_page.set_title("General")
-        general_page.set_icon_name("preferences-system-symbolic")
-        self.add(general_page)
-
-        general_group = Adw.PreferencesGroup()
-        general_group.set_title("Application")
-        general_group.set_description("Application behavior and startup options")
-        general_page.add(general_group)
+        general_page = self._add_page("General", "preferences-system-symbolic")
+        general_group = self._add_group(
+            general_page, "Application", "Application behavior and startup options"
+        )
 
         # Start at startup
-        self.startup_row = Adw.SwitchRow()
-        self.startup_row.set_title("Start at Login")
-
-        # Get current autostart status
-        is_autostart_enabled = self.settings.is_autostart_enabled()
-        self.startup_row.set_active(is_autostart_enabled)
-
-        # Set subtitle
-        if is_autostart_enabled:
-            self.startup_row.set_subtitle("Launch Lumux when you log in (enabled)")
-        else:
-            self.startup_row.set_subtitle("Launch Lumux when you log in")
+        self.startup_row = Adw.SwitchRow(title="Start at Login")
+        self._load_startup_row()
 
         # Connect to notify::active for immediate action
-        self.startup_row.connect("notify::active", self._on_startup_toggled)
-        general_group.add(self.startup_row)
-
-        # Minimize to tray when sync starts
-        self.minimize_row = Adw.SwitchRow()
-        self.minimize_row.set_title("Minimize to Tray on Sync")
-        self.minimize_row.set_subtitle(
-            "Automatically minimize the main window when sync starts"
+        self._startup_handler_id = self.startup_row.connect(
+            "notify::active", self._on_startup_toggled
         )
-        try:
-            self.minimize_row.set_active(self.settings.ui.minimize_to_tray_on_sync)
-        except Exception:
-            self.minimize_row.set_active(False)
-        general_group.add(self.minimize_row)
-
-        # Minimize at startup
-        self.minimize_startup_row = Adw.SwitchRow()
-        self.minimize_startup_row.set_title("Minimize at Startup")
-        self.minimize_startup_row.set_subtitle("Start Lumux minimized to system tray")
-        try:
-            self.minimize_startup_row.set_active(self.settings.ui.minimize_at_startup)
-        except Exception:
-            self.minimize_startup_row.set_active(False)
-        general_group.add(self.minimize_startup_row)
+        general_group.add(self.startup_row)
+        self._add_setting_rows(general_group, _GENERAL_ROWS)
 
         # Capture page
-        capture_page = Adw.PreferencesPage()
-        capture_page.set_title("Capture")
-        capture_page.set_icon_name("video-display-symbolic")
-        self.add(capture_page)
-
-        capture_group = Adw.PreferencesGroup()
-        capture_group.set_title("Screen Capture")
-        capture_group.set_description("Configure how the screen is captured")
-        capture_page.add(capture_group)
+        capture_page = self._add_page("Capture", "video-display-symbolic")
+        capture_group = self._add_group(
+            capture_page, "Screen Capture", "Configure how the screen is captured"
+        )
 
         # Capture source: entire screen or single window
-        self.capture_source_row = Adw.ComboRow()
-        self.capture_source_row.set_title("Capture Source")
-        self.capture_source_row.set_subtitle("What to capture for ambient lighting")
-        source_model = Gtk.StringList.new(["Entire screen", "Single window"])
-        self.capture_source_row.set_model(source_model)
-        self.capture_source_row.set_selected(
-            0 if self.settings.capture.source_type == "screen" else 1
+        self.capture_source_row = Adw.ComboRow(
+            title="Capture Source",
+            subtitle="What to capture for ambient lighting",
+            model=Gtk.StringList.new(["Entire screen", "Single window"]),
         )
         capture_group.add(self.capture_source_row)
+        self._add_setting_rows(capture_group, _CAPTURE_ROWS)
 
-        # Resolution scale
-        self.scale_row = Adw.SpinRow.new_with_range(0.01, 1.0, 0.01)
-        self.scale_row.set_title("Resolution Scale")
-        self.scale_row.set_subtitle("Lower values improve performance")
-        self.scale_row.set_digits(2)
-        self.scale_row.set_value(self.settings.capture.scale_factor)
-        capture_group.add(self.scale_row)
-
-        # Black bar detection group
-        blackbar_group = Adw.PreferencesGroup()
-        blackbar_group.set_title("Black Bar Detection")
-        blackbar_group.set_description(
-            "Automatically detect and ignore letterbox/pillarbox bars"
-        )
-        capture_page.add(blackbar_group)
-
-        # Enable black bar detection
-        self.blackbar_enable_row = Adw.SwitchRow()
-        self.blackbar_enable_row.set_title("Enable Detection")
-        self.blackbar_enable_row.set_subtitle("Ignore black bars around video content")
-        self.blackbar_enable_row.set_active(self.settings.black_bar.enabled)
-        blackbar_group.add(self.blackbar_enable_row)
-
-        # Threshold
-        self.blackbar_threshold_row = Adw.SpinRow.new_with_range(0, 50, 1)
-        self.blackbar_threshold_row.set_title("Luminance Threshold")
-        self.blackbar_threshold_row.set_subtitle(
-            "Brightness level considered black (0-50)"
+        blackbar_group = self._add_group(
+            capture_page,
+            "Black Bar Detection",
+            "Automatically detect and ignore letterbox/pillarbox bars",
         )
-        self.blackbar_threshold_row.set_digits(0)
-        self.blackbar_threshold_row.set_value(self.settings.black_bar.threshold)
-        blackbar_group.add(self.blackbar_threshold_row)
-
-        # Detection rate
-        self.blackbar_rate_row = Adw.SpinRow.new_with_range(1, 120, 1)
-        self.blackbar_rate_row.set_title("Detection Rate")
-        self.blackbar_rate_row.set_subtitle("Run detection every N frames (1-120)")
-        self.blackbar_rate_row.set_digits(0)
-        self.blackbar_rate_row.set_value(self.settings.black_bar.detection_rate)
-        blackbar_group.add(self.blackbar_rate_row)
+        self._add_setting_rows(blackbar_group, _BLACKBAR_ROWS)
 
         # Zones page
-        zones_page = Adw.PreferencesPage()
-        zones_page.set_title("Zones")
-        zones_page.set_icon_name("view-grid-symbolic")
-        self.add(zones_page)
-
-        zones_group = Adw.PreferencesGroup()
-        zones_group.set_title("Zone Configuration")
-        zones_group.set_description("Ambilight captures colors from screen edges")
-        zones_page.add(zones_group)
-
-        # Preview toggle
-        self.preview_row = Adw.SwitchRow()
-        self.preview_row.set_title("Show Zone Preview")
-        self.preview_row.set_subtitle("Display real-time zone visualization")
-        self.preview_row.set_active(self.settings.zones.show_preview)
-        zones_group.add(self.preview_row)
-
-        # Zone grid size (rows / columns)
-        self.rows_row = Adw.SpinRow.new_with_range(1, 64, 1)
-        self.rows_row.set_title("Edge Rows")
-        self.rows_row.set_subtitle("Number of zones along left/right edges")
-        self.rows_row.set_digits(0)
-        self.rows_row.set_value(self.settings.zones.rows)
-        zones_group.add(self.rows_row)
-
-        self.cols_row = Adw.SpinRow.new_with_range(1, 64, 1)
-        self.cols_row.set_title("Edge Columns")
-        self.cols_row.set_subtitle("Number of zones along top/bottom edges")
-        self.cols_row.set_digits(0)
-        self.cols_row.set_value(self.settings.zones.cols)
-        zones_group.add(self.cols_row)
+        zones_page = self._add_page("Zones", "view-grid-symbolic")
+        zones_group = self._add_group(
+            zones_page,
+            "Zone Configuration",
+            "Ambilight captures colors from screen edges",
+        )
+        self._add_setting_rows(zones_group, _ZONE_ROWS)
 
         # Sync page
-        sync_page = Adw.PreferencesPage()
-        sync_page.set_title("Sync")
-        sync_page.set_icon_name("emblem-synchronizing-symbolic")
-        self.add(sync_page)
-
-        sync_group = Adw.PreferencesGroup()
-        sync_group.set_title("Sync Settings")
-        sync_group.set_description("Fine-tune synchronization behavior")
-        sync_page.add(sync_group)
-
-        # Target FPS
-        self.fps_row = Adw.SpinRow.new_with_range(1, 60, 1)
-        self.fps_row.set_title("Target FPS")
-        self.fps_row.set_subtitle("Frames per second for sync updates")
-        self.fps_row.set_value(self.settings.sync.fps)
-        sync_group.add(self.fps_row)
-
-        # Transition time (max 1000 ms)
-        self.transition_row = Adw.SpinRow.new_with_range(0, 1000, 50)
-        self.transition_row.set_title("Transition Time")
-        self.transition_row.set_subtitle("Milliseconds for color transitions")
-        self.transition_row.set_value(self.settings.sync.transition_time_ms)
-        sync_group.add(self.transition_row)
-
-        # Color group
-        color_group = Adw.PreferencesGroup()
-        color_group.set_title("Color Adjustments")
-        color_group.set_description("Adjust brightness and color processing")
-        sync_page.add(color_group)
-
-        # Brightness scale
-        self.brightness_row = Adw.SpinRow.new_with_range(0.0, 2.0, 0.1)
-        self.brightness_row.set_title("Brightness Scale")
-        self.brightness_row.set_subtitle("Multiply light brightness")
-        self.brightness_row.set_digits(1)
-        self.brightness_row.set_value(self.settings.sync.brightness_scale)
-        color_group.add(self.brightness_row)
-
-        # Gamma
-        self.gamma_row = Adw.SpinRow.new_with_range(0.1, 3.0, 0.1)
-        self.gamma_row.set_title("Gamma")
-        self.gamma_row.set_subtitle("Gamma correction for colors")
-        self.gamma_row.set_digits(2)
-        self.gamma_row.set_value(self.settings.sync.gamma)
-        color_group.add(self.gamma_row)
-
-        # Smoothing factor (minimum 0.1)
-        self.smoothing_row = Adw.SpinRow.new_with_range(0.1, 1.0, 0.1)
-        self.smoothing_row.set_title("Smoothing Factor")
-        self.smoothing_row.set_subtitle("Smooth color transitions")
-        self.smoothing_row.set_digits(1)
-        self.smoothing_row.set_value(self.settings.sync.smoothing_factor)
-        color_group.add(self.smoothing_row)
+        sync_page = self._add_page("Sync", "emblem-synchronizing-symbolic")
+        sync_group = self._add_group(
+            sync_page, "Sync Settings", "Fine-tune synchronization behavior"
+        )
+        self._add_setting_rows(sync_group, _SYNC_ROWS)
 
-        # Reading Mode page
-        reading_page = Adw.PreferencesPage()
-        reading_page.set_title("Reading")
-        reading_page.set_icon_name("weather-clear-night-symbolic")
-        self.add(reading_page)
+        color_group = self._add_group(
+            sync_page, "Color Adjustments", "Adjust brightness and color processing"
+        )
+        self._add_setting_rows(color_group, _COLOR_ROWS)
 
-        reading_group = Adw.PreferencesGroup()
-        reading_group.set_title("Reading Mode")
-        reading_group.set_description("Static lighting for reading and relaxation")
-        reading_page.add(reading_group)
+        # Reading Mode page
+        reading_page = self._add_page("Reading", "weather-clear-night-symbolic")
+        reading_group = self._add_group(
+            reading_page,
+            "Reading Mode",
+            "Static lighting for reading and relaxation",
+        )
 
         # Default color row
-        color_row = Adw.ActionRow()
-        color_row.set_title("Default Color")
-        color_row.set_subtitle("Color used when activating reading mode")
-
-        self.reading_color_btn = Gtk.ColorDialogButton()
-        color_dialog = Gtk.ColorDialog()
-        color_dialog.set_title("Select Default Reading Color")
-        self.reading_color_btn.set_dialog(color_dialog)
-        # Set current color from settings
+        color_row = Adw.ActionRow(
+            title="Default Color",
+            subtitle="Color used when activating reading mode",
+        )
+        self.reading_color_btn = Gtk.ColorDialogButton(
+            dialog=_get_color_dialog(), valign=Gtk.Align.CENTER
+        )
+        self._reading_color_dirty = False
+        self.reading_color_btn.connect("notify::rgba", self._on_reading_color_changed)
+        color_row.add_suffix(self.reading_color_btn)
+        reading_group.add(color_row)
+        self._add_setting_rows(reading_group, _READING_ROWS)
+
+        self._load_setting_rows()
+
+        # Connect close signal to save settings
+        self.connect("closed", self._on_closed)
+
+    def _add_page(self, title: str, icon_name: str) -> Adw.PreferencesPage:
+        """Create a preferences page and add it to the dialog."""
+        page = Adw.PreferencesPage(title=title, icon_name=icon_name)
+        self.add(page)
+        return page
+
+    def _add_group(
+        self, page: Adw.PreferencesPage, title: str, description: str = ""
+    ) -> Adw.PreferencesGroup:
+        """Create a preferences group and add it to a page."""
+        group = Adw.PreferencesGroup(title=title, description=description)
+        page.add(group)
+        return group
+
+    def _add_setting_rows(self, group: Adw.PreferencesGroup, specs) -> None:
+        """Build switch/spin rows from a spec table and add them to a group.
+
+        Args:
+            group: Group the rows are appended to
+            specs: Sequence of (attribute, title, subtitle, settings path,
+                spin range) tuples; spin range is (lower, upper, step, digits)
+                or None for a switch row
+        """
+        for attr, title, subtitle, path, spin_range in specs:
+            if spin_range is None:
+                row = Adw.SwitchRow(title=title, subtitle=subtitle)
+            else:
+                lower, upper, step, digits = spin_range
+                adjustment = Gtk.Adjustment(
+                    lower=lower,
+                    upper=upper,
+                    step_increment=step,
+                    page_increment=step * 10,
+                )
+                row = Adw.SpinRow(
+                    title=title,
+                    subtitle=subtitle,
+                    adjustment=adjustment,
+                    digits=digits,
+                )
+            if spin_range is None:
+                caster = bool
+            else:
+                caster = int if spin_range[3] == 0 else float
+            setattr(self, attr, row)
+            self._setting_rows.append((row, path, operator.attrgetter(path)))
+            # Write-through binding: edits land in settings immediately, so
+            # closing only has to persist them
+            prop = "notify::active" if spin_range is None else "notify::value"
+            row.connect(prop, self._on_setting_row_changed, path, caster)
+            group.add(row)
+
+    def _on_setting_row_changed(self, row, pspec, path: str, caster) -> None:
+        """Copy a table-built row's new value into its settings field."""
+        if isinstance(row, Adw.SwitchRow):
+            value = row.get_active()
+        else:
+            value = row.get_value()
+        try:
+            _set_by_path(self.settings, path, caster(value))
+        except Exception as e:
+            print(f"Error updating setting {path}: {e}")
+
+    def _add_entry_rows(self, group: Adw.PreferencesGroup, specs) -> None:
+        """Build text entry rows from a spec table and add them to a group.
+
+        Args:
+            group: Group the rows are appended to
+            specs: Sequence of (attribute, title, settings path, secret)
+                tuples; secret rows use a password entry
+        """
+        for attr, title, path, secret in specs:
+            if secret:
+                row = Adw.PasswordEntryRow(title=title)
+            else:
+                row = Adw.EntryRow(title=title, show_apply_button=False)
+            setattr(self, attr, row)
+            self._entry_rows.append((row, path, operator.attrgetter(path)))
+            group.add(row)
+
+    def _load_entry_rows(self) -> None:
+        """Copy current bridge credentials into the entry rows."""
+        for row, _path, getter in self._entry_rows:
+            row.set_text(getter(self.settings))
+
+    def _load_setting_rows(self) -> None:
+        """Copy current settings into every settings-backed row."""
+        self.capture_source_row.set_selected(
+            0 if self.settings.capture.source_type == "screen" else 1
+        )
+        for row, _path, getter in self._setting_rows:
+            value = getter(self.settings)
+            if isinstance(row, Adw.SwitchRow):
+                row.set_active(bool(value))
+            else:
+                row.set_value(value)
+
         rgba = Gdk.RGBA()
         xy = self.settings.reading_mode.color_xy
         # Approximate XY to RGB conversion for display
-        r, g, b = xy_to_rgb(xy[0], xy[1], as_int=False)
-        rgba.red = r
-        rgba.green = g
-        rgba.blue = b
+        rgba.red, rgba.green, rgba.blue = xy_to_rgb(xy[0], xy[1], as_int=False)
         rgba.alpha = 1.0
         self.reading_color_btn.set_rgba(rgba)
-        self.reading_color_btn.set_valign(Gtk.Align.CENTER)
-        color_row.add_suffix(self.reading_color_btn)
-        reading_group.add(color_row)
+        # Loading from settings is not a user edit
+        self._reading_color_dirty = False
 
-        # Default brightness
-        self.reading_brightness_row = Adw.SpinRow.new_with_range(0, 254, 1)
-        self.reading_brightness_row.set_title("Default Brightness")
-        self.reading_brightness_row.set_subtitle(
-            "Brightness level for reading mode (0-254)"
-        )
-        self.reading_brightness_row.set_digits(0)
-        self.reading_brightness_row.set_value(self.settings.reading_mode.brightness)
-        reading_group.add(self.reading_brightness_row)
-
-        # Auto-activate reading mode on stop
-        self.reading_auto_row = Adw.SwitchRow()
-        self.reading_auto_row.set_title("Auto-activate on Stop")
-        self.reading_auto_row.set_subtitle(
-            "Automatically switch to reading mode when video sync stops"
-        )
-        self.reading_auto_row.set_active(self.settings.reading_mode.auto_activate)
-        reading_group.add(self.reading_auto_row)
-
-        # Auto-activate reading mode on startup
-        self.reading_auto_startup_row = Adw.SwitchRow()
-        self.reading_auto_startup_row.set_title("Auto-activate on Startup")
-        self.reading_auto_startup_row.set_subtitle(
-            "Automatically switch to reading mode when app starts"
-        )
-        self.reading_auto_startup_row.set_active(
-            self.settings.reading_mode.auto_activate_on_startup
-        )
-        reading_group.add(self.reading_auto_startup_row)
+    def _on_reading_color_changed(self, button, pspec) -> None:
+        self._reading_color_dirty = True
 
-        # Connect close signal to save settings
-        self.connect("closed", self._on_closed)
+    def _load_startup_row(self) -> None:
+        """Reflect the current autostart state in the startup row."""
+        is_autostart_enabled = self.settings.is_autostart_enabled()
+        self.startup_row.set_active(is_autostart_enabled)
+        if is_autostart_enabled:
+            self.startup_row.set_subtitle("Launch Lumux when you log in (enabled)")
+        else:
+            self.startup_row.set_subtitle("Launch Lumux when you log in")
+
+    def refresh(self):
+        """Re-read current settings into the rows before re-presenting.
+
+        The dialog is kept alive between opens, so values changed elsewhere
+        (wizard, main window reading controls) must be pulled in again.
+        """
+        self._load_entry_rows()
+
+        # Avoid re-running enable/disable_autostart while syncing the switch
+        with self.startup_row.handler_block(self._startup_handler_id):
+            self._load_startup_row()
+
+        self._load_setting_rows()
+
+        self._connect_after_status = True
+        self._update_bridge_status()
+        self._load_entertainment_configs()
 
     def _on_start_wizard(self, button):
         """Launch the bridge setup wizard."""
+        # Only this path needs the wizard; import it on demand
+        from lumux.gui.bridge_wizard import BridgeWizard
+
         wizard = BridgeWizard(
             app_context=self.settings, on_finished=self._on_wizard_finished
         )
@@ -413,24 +551,42 @@ class SettingsDialog(Adw.PreferencesDialog):
         self.app_context.apply_settings()
 
         # Update UI with new settings
-        self.ip_row.set_text(bridge_ip)
-        self.key_row.set_text(app_key)
-        self.client_key_row.set_text(client_key)
+        self._load_entry_rows()
 
         # Update status
-        self._update_bridge_status()
+        self._update_bridge_status(force=True)
 
         # Refresh entertainment zones
         self._load_entertainment_configs()
 
-    def _update_bridge_status(self):
-        """Update bridge connection status display."""
+    def _update_bridge_status(self, force: bool = False):
+        """Update bridge connection status display.
+
+        Args:
+            force: Probe the bridge and try to connect instead of reusing
+                the recently cached status
+        """
+        self.app_context.get_bridge_status_async(
+            self._on_bridge_status_received, attempt_connect=force, force=force
+        )
+
+    def _on_test_connection(self, button):
+        """Explicitly re-check the bridge connection."""
+        self._update_bridge_status(force=True)
+
+    def _update_bridge_status_async(self) -> bool:
+        """Deferred follow-up that tries to connect to a configured bridge."""
         self.app_context.get_bridge_status_async(
             self._on_bridge_status_received, attempt_connect=True
         )
+        return False
 
     def _on_bridge_status_received(self, status):
         """Handle bridge status result from background thread."""
+        if self._connect_after_status:
+            self._connect_after_status = False
+            if status.configured and not status.connected:
+                GLib.idle_add(self._update_bridge_status_async)
         if status.connected:
             self.status_row.set_subtitle("Connected")
             self.status_icon.set_from_icon_name("network-transmit-receive-symbolic")
@@ -439,39 +595,67 @@ class SettingsDialog(Adw.PreferencesDialog):
             self.status_icon.set_from_icon_name("network-offline-symbolic")
 
     def _load_entertainment_configs(self):
-        """Load entertainment configurations from bridge."""
+        """Load entertainment configurations from bridge in the background.
+
+        The bridge round-trips run in a worker thread so the dialog can paint
+        immediately; the combo shows a placeholder until results arrive.
+        """
         self._entertainment_configs = []
 
-        if not self.bridge.test_connection():
-            model = Gtk.StringList.new(["(Connect to bridge first)"])
-            self.ent_row.set_model(model)
-            self.ent_row.set_selected(0)
-            return
+        if self._ent_cancellable is not None:
+            self._ent_cancellable.cancel()
+        cancellable = Gio.Cancellable()
+        self._ent_cancellable = cancellable
+
+        self._set_ent_labels(["Loading…"])
+
+        def _worker():
+            configs = None
+            try:
+                if self.bridge.test_connection():
+                    configs = self.bridge.get_entertainment_configurations()
+            except Exception as e:
+                print(f"Error loading entertainment configurations: {e}")
+            GLib.idle_add(self._on_entertainment_configs_loaded, configs, cancellable)
+
+        threading.Thread(target=_worker, daemon=True).start()
+
+    def _on_entertainment_configs_loaded(self, configs, cancellable) -> bool:
+        """Fill the entertainment combo on the main thread.
+
+        Args:
+            configs: Configurations from the bridge, or None if not connected
+            cancellable: Cancellable of the load that produced the result
+        """
+        if cancellable.is_cancelled():
+            return False
+        self._ent_cancellable = None
+
+        if configs is None:
+            self._set_ent_labels(["(Connect to bridge first)"])
+            return False
 
-        configs = self.bridge.get_entertainment_configurations()
         self._entertainment_configs = configs
 
         if not configs:
-            model = Gtk.StringList.new(["(No entertainment zones found)"])
-            self.ent_row.set_model(model)
-            self.ent_row.set_selected(0)
-            return
+            self._set_ent_labels(["(No entertainment zones found)"])
+            return False
 
         current_id = self.settings.hue.entertainment_config_id
-        selected_idx = 0
-        labels = []
-
-        for i, config in enumerate(configs):
-            config_id = config.get("id", "")
-            name = config.get("name", "Unknown")
-            channels = len(config.get("channels", []))
-            label = f"{name} ({channels} channels)"
-            labels.append(label)
-            if config_id == current_id:
-                selected_idx = i
-
-        model = Gtk.StringList.new(labels)
-        self.ent_row.set_model(model)
+        labels = [
+            f"{c.get('name', 'Unknown')} ({len(c.get('channels', []))} channels)"
+            for c in configs
+        ]
+        selected_idx = next(
+            (i for i, c in enumerate(configs) if c.get("id", "") == current_id), 0
+        )
+
+        self._set_ent_labels(labels, selected_idx)
+        return False
+
+    def _set_ent_labels(self, labels, selected_idx: int = 0) -> None:
+        """Replace the entertainment combo items without swapping its model."""
+        self._ent_model.splice(0, self._ent_model.get_n_items(), labels)
         self.ent_row.set_selected(selected_idx)
 
     def _on_refresh_entertainment_configs(self, button):
@@ -505,18 +689,21 @@ class SettingsDialog(Adw.PreferencesDialog):
 
     def _show_flatpak_permission_dialog(self):
         """Show dialog explaining how to grant Flatpak permission for autostart."""
+        if self._flatpak_dialog is None:
+            self._flatpak_dialog = self._build_flatpak_permission_dialog()
+        self._flatpak_dialog.present()
+
+    def _build_flatpak_permission_dialog(self) -> Adw.MessageDialog:
+        """Build the Flatpak permission dialog; kept and re-presented later."""
         dialog = Adw.MessageDialog(
             transient_for=self._parent,
             heading="Permission Required",
             body="Lumux needs access to your home directory to enable automatic startup. This permission allows Lumux to create a startup entry in your system.",
+            # Hide instead of destroying on close so it can be shown again
+            hide_on_close=True,
         )
         dialog.set_default_size(440, -1)
 
-        # Add the command as a selectable label
-        command = (
-            "flatpak override --user --filesystem=host io.github.enginkirmaci.lumux"
-        )
-
         dialog.add_response("copy", "Copy Command")
         dialog.add_response("close", "Close")
         dialog.set_default_response("close")
@@ -533,7 +720,7 @@ class SettingsDialog(Adw.PreferencesDialog):
 
         # Command entry (selectable)
         command_entry = Gtk.Entry()
-        command_entry.set_text(command)
+        command_entry.set_text(_FLATPAK_OVERRIDE_COMMAND)
         command_entry.set_editable(False)
         command_entry.set_can_focus(True)
         extra_box.append(command_entry)
@@ -549,8 +736,11 @@ class SettingsDialog(Adw.PreferencesDialog):
 
         dialog.set_extra_child(extra_box)
 
-        dialog.connect("response", self._on_flatpak_dialog_response, command)
-        dialog.present()
+        # Connected once; the dialog is reused for later presentations
+        dialog.connect(
+            "response", self._on_flatpak_dialog_response, _FLATPAK_OVERRIDE_COMMAND
+        )
+        return dialog
 
     def _on_flatpak_dialog_response(self, dialog, response, command):
         """Handle Flatpak permission dialog response."""
@@ -564,100 +754,58 @@ class SettingsDialog(Adw.PreferencesDialog):
 
     def _on_closed(self, dialog):
         """Handle dialog close - save settings."""
-        self._save_settings()
-
-    def _save_settings(self):
-        """Save all settings from the dialog."""
-        self.settings.hue.bridge_ip = self.ip_row.get_text()
-        self.settings.hue.app_key = self.key_row.get_text()
-        self.settings.hue.client_key = self.client_key_row.get_text()
+        loading = self._ent_cancellable is not None
+        if loading:
+            self._ent_cancellable.cancel()
+            self._ent_cancellable = None
+        self._save_settings(keep_entertainment_config=loading)
+
+    def _save_settings(self, keep_entertainment_config: bool = False):
+        """Save all settings from the dialog.
+
+        Args:
+            keep_entertainment_config: Leave the entertainment zone untouched,
+                used when the zone list had not finished loading
+        """
+        hue = {
+            path.rpartition(".")[2]: row.get_text()
+            for row, path, _getter in self._entry_rows
+        }
 
         # Get entertainment config ID
         selected = self.ent_row.get_selected()
-        if self._entertainment_configs and selected < len(self._entertainment_configs):
-            self.settings.hue.entertainment_config_id = self._entertainment_configs[
+        if keep_entertainment_config:
+            pass
+        elif self._entertainment_configs and selected < len(
+            self._entertainment_configs
+        ):
+            hue["entertainment_config_id"] = self._entertainment_configs[
                 selected
             ].get("id", "")
         else:
-            self.settings.hue.entertainment_config_id = ""
-
-        self.settings.capture.source_type = (
-            "window" if self.capture_source_row.get_selected() == 1 else "screen"
-        )
-        self.settings.capture.scale_factor = self.scale_row.get_value()
-
-        # Black bar settings
-        try:
-            self.settings.black_bar.enabled = bool(
-                self.blackbar_enable_row.get_active()
-            )
-        except Exception:
-            self.settings.black_bar.enabled = False
-        try:
-            self.settings.black_bar.threshold = int(
-                self.blackbar_threshold_row.get_value()
-            )
-        except Exception:
-            self.settings.black_bar.threshold = 10
-        try:
-            self.settings.black_bar.detection_rate = int(
-                self.blackbar_rate_row.get_value()
-            )
-        except Exception:
-            self.settings.black_bar.detection_rate = 30
-
-        # Zone settings
-        self.settings.zones.show_preview = self.preview_row.get_active()
-        # Grid size
-        try:
-            self.settings.zones.rows = int(self.rows_row.get_value())
-        except Exception:
-            self.settings.zones.rows = 16
-        try:
-            self.settings.zones.cols = int(self.cols_row.get_value())
-        except Exception:
-            self.settings.zones.cols = 16
-
-        # Sync settings
-        self.settings.sync.fps = int(self.fps_row.get_value())
-        self.settings.sync.transition_time_ms = int(self.transition_row.get_value())
-        self.settings.sync.brightness_scale = self.brightness_row.get_value()
-        self.settings.sync.gamma = self.gamma_row.get_value()
-        self.settings.sync.smoothing_factor = self.smoothing_row.get_value()
-        # UI settings - startup is handled immediately in _on_startup_toggled
-        # but we ensure the setting matches the current state
-        if hasattr(self, "startup_row"):
-            try:
-                self.settings.ui.start_at_startup = bool(self.startup_row.get_active())
-            except Exception:
-                pass
-
-        try:
-            self.settings.ui.minimize_to_tray_on_sync = bool(
-                self.minimize_row.get_active()
+            hue["entertainment_config_id"] = ""
+
+        values = {
+            "hue": hue,
+            "capture": {
+                "source_type": (
+                    "window"
+                    if self.capture_source_row.get_selected() == 1
+                    else "screen"
+                )
+            },
+        }
+        # Table-built rows are already written through on edit
+        # UI settings - start_at_startup is owned by _on_startup_toggled
+
+        # Reading mode settings; only convert when the user picked a color
+        if self._reading_color_dirty:
+            rgba = self.reading_color_btn.get_rgba()
+            xy = rgb_to_xy(
+                int(rgba.red * 255), int(rgba.green * 255), int(rgba.blue * 255)
             )
-        except Exception:
-            pass
-
-        try:
-            self.settings.ui.minimize_at_startup = bool(
-                self.minimize_startup_row.get_active()
-            )
-        except Exception:
-            pass
-
-        # Reading mode settings
-        rgba = self.reading_color_btn.get_rgba()
-        xy = rgb_to_xy(int(rgba.red * 255), int(rgba.green * 255), int(rgba.blue * 255))
-        self.settings.reading_mode.color_xy = xy
-        self.settings.reading_mode.brightness = int(
-            self.reading_brightness_row.get_value()
-        )
-        self.settings.reading_mode.auto_activate = bool(
-            self.reading_auto_row.get_active()
-        )
-        self.settings.reading_mode.auto_activate_on_startup = bool(
-            self.reading_auto_startup_row.get_active()
-        )
+            values["reading_mode"] = {"color_xy": xy}
+            self._reading_color_dirty = False
 
+        self.settings.update(values)
         self.settings.save()
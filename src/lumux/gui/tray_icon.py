@@ -12,19 +12,41 @@ For Flatpak support, the manifest must include:
   - --talk-name=org.freedesktop.Notifications
 """
 
+import atexit
 import os
+import signal
 import sys
-import subprocess
 import threading
-import json
+import time
+from functools import lru_cache
+from pathlib import Path
 import gi
 
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
 from gi.repository import GLib
-from typing import Optional
+from typing import List, Optional, Tuple
 
+from lumux.config.settings_manager import is_running_in_flatpak
+from lumux.gui._tray_protocol import (
+    FRAME,
+    OP_QUIT,
+    OP_SETTINGS,
+    OP_SHOW,
+    OP_TOGGLE,
+    QUIT_FRAME,
+    READ_SIZE,
+    SYNC_FRAMES,
+)
 
+
+_GUI_DIR = Path(__file__).resolve().parent
+
+# Package root (src/lumux), where the development icon lives next to main.py
+_PKG_ROOT = _GUI_DIR.parent
+
+
+@lru_cache(maxsize=1)
 def _get_icon_path() -> str:
     """Get the app icon path, handling both development and installed scenarios.
 
@@ -38,12 +60,9 @@ def _get_icon_path() -> str:
         return flatpak_icon
 
     # Development/native location (next to main.py)
-    dev_icon = os.path.join(
-        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-        "io.github.enginkirmaci.lumux.svg",
-    )
-    if os.path.exists(dev_icon):
-        return dev_icon
+    dev_icon = _PKG_ROOT / "io.github.enginkirmaci.lumux.svg"
+    if dev_icon.exists():
+        return str(dev_icon)
 
     # Fallback to icon name (requires icon to be in theme)
     return "io.github.enginkirmaci.lumux"
@@ -51,6 +70,326 @@ def _get_icon_path() -> str:
 
 APP_ICON_PATH = _get_icon_path()
 
+# Tray process entry points, run as scripts next to this module
+_SNI_SCRIPT = str(_GUI_DIR / "_tray_sni.py")
+_APPINDICATOR_SCRIPT = str(_GUI_DIR / "_tray_appindicator.py")
+
+
+def _rasterize_argb(path: str, size: int) -> Optional[Tuple[int, int, bytes]]:
+    """Render an icon file to SNI pixmap data.
+
+    Args:
+        path: Icon file path
+        size: Target width and height in pixels
+
+    Returns:
+        Tuple of (width, height, ARGB32 bytes in network order), or None if
+        the icon could not be loaded
+    """
+    try:
+        gi.require_version("GdkPixbuf", "2.0")
+        from gi.repository import GdkPixbuf
+
+        pb = GdkPixbuf.Pixbuf.new_from_file_at_scale(path, size, size, True)
+    except Exception:
+        return None
+
+    if not pb.get_has_alpha():
+        pb = pb.add_alpha(False, 0, 0, 0)
+    w, h, rs = pb.get_width(), pb.get_height(), pb.get_rowstride()
+    pixels = pb.read_pixel_bytes().get_data()
+
+    # Drop row padding, then reorder RGBA to ARGB with strided copies
+    rgba = b"".join(pixels[y * rs : y * rs + w * 4] for y in range(h))
+    argb = bytearray(len(rgba))
+    argb[0::4], argb[1::4], argb[2::4], argb[3::4] = (
+        rgba[3::4],
+        rgba[0::4],
+        rgba[1::4],
+        rgba[2::4],
+    )
+    return w, h, bytes(argb)
+
+
+@lru_cache(maxsize=None)
+def _sni_pixmap_arg(icon_path: str) -> str:
+    """Pre-render the SNI icon and encode it as a tray script argument.
+
+    Rasterizing here spares every tray start an SVG render; the result is
+    cached since the icon does not change while the app runs.
+
+    Returns:
+        "WIDTH:HEIGHT:ARGB-HEX", or "" if the icon could not be rendered
+    """
+    pixmap = _rasterize_argb(icon_path, 22)
+    if not pixmap:
+        return ""
+    width, height, argb = pixmap
+    return f"{width}:{height}:{argb.hex()}"
+
+
+_SNI_WATCHERS = (
+    "org.kde.StatusNotifierWatcher",
+    "org.freedesktop.StatusNotifierWatcher",
+)
+
+# (GIR namespace, backend name) in order of preference
+_APPINDICATOR_NAMESPACES = (
+    ("AyatanaAppIndicator3", "ayatana"),
+    ("AppIndicator3", "appindicator"),
+)
+
+# Detected backend; "" once probed with nothing found
+_BACKEND_CACHE: Optional[str] = None
+
+# Watcher that answered the SNI probe, if any
+_SNI_WATCHER: Optional[str] = None
+
+
+def _detect_tray_backend_inproc() -> Optional[str]:
+    """Probe for a tray backend from within the app process.
+
+    AppIndicator typelibs are only looked up in the GIR repository, never
+    imported, since loading them would pull GTK3 into this GTK4 process.
+    The result is cached for the lifetime of the process.
+
+    Returns:
+        Backend name ('sni', 'ayatana', 'appindicator') or None if unavailable
+    """
+    global _BACKEND_CACHE, _SNI_WATCHER
+    if _BACKEND_CACHE is not None:
+        return _BACKEND_CACHE or None
+
+    backend = ""
+    try:
+        import pydbus
+
+        try:
+            bus = pydbus.SessionBus()
+            for watcher in _SNI_WATCHERS:
+                try:
+                    if bus.get(watcher).IsStatusNotifierHostRegistered:
+                        backend = "sni"
+                        _SNI_WATCHER = watcher
+                        break
+                except Exception:
+                    pass
+        except Exception:
+            pass
+
+        if not backend and is_running_in_flatpak():
+            backend = "sni"
+    except Exception:
+        pass
+
+    if not backend:
+        try:
+            repository = gi.Repository.get_default()
+            for namespace, name in _APPINDICATOR_NAMESPACES:
+                if "0.1" in repository.enumerate_versions(namespace):
+                    backend = name
+                    break
+        except Exception:
+            pass
+
+    _BACKEND_CACHE = backend
+    return backend or None
+
+
+def _spawn_tray_process(
+    script: str, cmd_fd: int, event_fd: int, args: List[str]
+) -> int:
+    """Start a tray script with posix_spawn in its own session.
+
+    subprocess.Popen falls back to fork+exec whenever pass_fds, close_fds
+    or start_new_session is requested, and forking copies the page tables
+    of the whole GTK process. The pipe ends are made inheritable for the
+    spawn; descriptors opened by Python are close-on-exec already.
+
+    Args:
+        script: Path of the tray script to run
+        cmd_fd: Read end of the app-to-tray pipe
+        event_fd: Write end of the tray-to-app pipe
+        args: Backend-specific arguments following the descriptors
+
+    Returns:
+        Process ID of the tray process
+    """
+    os.set_inheritable(cmd_fd, True)
+    os.set_inheritable(event_fd, True)
+    return os.posix_spawn(
+        sys.executable,
+        [sys.executable, script, str(cmd_fd), str(event_fd), *args],
+        os.environ,
+        file_actions=[
+            (os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0),
+            (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+            (os.POSIX_SPAWN_DUP2, 1, 2),
+        ],
+        setsid=True,
+    )
+
+
+def _wait_for_exit(pid: int, timeout: float) -> bool:
+    """Poll for a child to exit, reaping it.
+
+    Returns:
+        True once the child is gone, False if it outlived the timeout
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            if os.waitpid(pid, os.WNOHANG)[0]:
+                return True
+        except ChildProcessError:
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.05)
+
+
+# Tray processes spawned and not yet reaped
+_LIVE_TRAY_PIDS = set()
+
+
+def _reap_tray_process(pid: int):
+    """Wait for a tray process to exit, escalating to signals if needed."""
+    # The tray quits as soon as its command pipe closes, so the grace
+    # period is short before signalling the tray's whole session
+    try:
+        for sig, timeout in (
+            (None, 0.2),
+            (signal.SIGTERM, 0.2),
+            (signal.SIGKILL, 1.0),
+        ):
+            if sig is not None:
+                try:
+                    os.killpg(pid, sig)
+                except Exception:
+                    return
+            if _wait_for_exit(pid, timeout):
+                return
+    finally:
+        _LIVE_TRAY_PIDS.discard(pid)
+
+
+@atexit.register
+def _reap_live_tray_processes():
+    """Make sure no tray outlives the app, even if destroy() never ran."""
+    for pid in list(_LIVE_TRAY_PIDS):
+        _reap_tray_process(pid)
+
+
+def _launch_tray_process() -> Optional[Tuple[str, int, int, int]]:
+    """Detect the tray backend and spawn its process.
+
+    Returns:
+        Tuple of (backend, pid, command pipe write fd, event pipe read fd),
+        or None if no tray backend is available
+    """
+    backend = _detect_tray_backend_inproc()
+    if not backend:
+        return None
+
+    if backend == "sni":
+        watchers = (_SNI_WATCHER,) if _SNI_WATCHER else _SNI_WATCHERS
+        tray_script = _SNI_SCRIPT
+        tray_args = [_sni_pixmap_arg(APP_ICON_PATH), *watchers]
+    else:
+        # APP_ICON_PATH is either an existing file or the themed icon name
+        tray_script = _APPINDICATOR_SCRIPT
+        tray_args = [backend, APP_ICON_PATH]
+
+    # Dedicated command pipes; the child's stdout/stderr stay free for logs
+    cmd_read, cmd_write = os.pipe()  # app -> tray
+    event_read, event_write = os.pipe()  # tray -> app
+    try:
+        # Own session so a terminal SIGINT doesn't reach the tray
+        # before the quit handshake; its GTK/D-Bus chatter is dropped
+        pid = _spawn_tray_process(tray_script, cmd_read, event_write, tray_args)
+        _LIVE_TRAY_PIDS.add(pid)
+    except Exception:
+        os.close(cmd_write)
+        os.close(event_read)
+        raise
+    finally:
+        os.close(cmd_read)
+        os.close(event_write)
+
+    # Both ends are serviced on the GTK main loop, which must never block
+    os.set_blocking(cmd_write, False)
+    os.set_blocking(event_read, False)
+    return backend, pid, cmd_write, event_read
+
+
+# The primary instance launches the tray on a background thread before it
+# builds the main window, so the D-Bus probe, icon render and spawn overlap
+# that work. The first TrayIcon adopts the result; later ones launch their own.
+_PREWARM_TIMEOUT = 10.0
+_prewarm_done = threading.Event()
+_prewarm_lock = threading.Lock()
+_prewarm_result = None  # launch tuple, None, or the exception raised
+_prewarm_state = "idle"  # -> "running" -> "taken" or "abandoned"
+
+
+def prewarm_tray() -> None:
+    """Start launching the tray process in the background.
+
+    Call once from the primary instance before the main window is built;
+    later calls, or calls after a TrayIcon already launched, do nothing.
+    """
+    global _prewarm_state
+    with _prewarm_lock:
+        if _prewarm_state != "idle":
+            return
+        _prewarm_state = "running"
+    threading.Thread(target=_prewarm_tray, daemon=True).start()
+
+
+def _prewarm_tray():
+    global _prewarm_result
+    try:
+        result = _launch_tray_process()
+    except Exception as e:
+        result = e
+
+    with _prewarm_lock:
+        _prewarm_result = result
+        abandoned = _prewarm_state == "abandoned"
+    _prewarm_done.set()
+
+    if abandoned and isinstance(result, tuple):
+        # Nobody will adopt it; closing the pipes makes the tray quit
+        os.close(result[2])
+        os.close(result[3])
+        _reap_tray_process(result[1])
+
+
+def _take_tray_launch() -> Optional[Tuple[str, int, int, int]]:
+    """Return the pre-warmed tray launch, waiting for it if needed.
+
+    Raises:
+        Exception: Whatever the launch raised, or TimeoutError
+    """
+    global _prewarm_state
+    with _prewarm_lock:
+        first = _prewarm_state == "running"
+        if _prewarm_state in ("idle", "running"):
+            # A prewarm requested after this would have nobody to adopt it
+            _prewarm_state = "taken"
+    if not first:
+        return _launch_tray_process()
+
+    if not _prewarm_done.wait(_PREWARM_TIMEOUT):
+        with _prewarm_lock:
+            if not _prewarm_done.is_set():
+                _prewarm_state = "abandoned"
+                raise TimeoutError("tray launch timed out")
+
+    if isinstance(_prewarm_result, Exception):
+        raise _prewarm_result
+    return _prewarm_result
+
 
 class TrayIcon:
     """System tray icon with menu for Lumux application.
@@ -61,6 +400,9 @@ class TrayIcon:
     Supports multiple tray backends:
     - D-Bus StatusNotifierItem (SNI) - Modern cross-desktop standard
     - AppIndicator3 / AyatanaAppIndicator3 - Fallback for Ubuntu/Unity
+
+    The tray process is owned by this instance and exits with the app, so
+    a tray icon is never left behind without a window to answer it.
     """
 
     def __init__(self, app, main_window):
@@ -72,59 +414,36 @@ class TrayIcon:
         """
         self.app = app
         self.main_window = main_window
-        self._process: Optional[subprocess.Popen] = None
-        self._listener_thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._event_watch_id = 0
+        self._sync_timer_id = 0
+        # Raw pipe descriptors; frames go through os.write/os.read directly
+        self._cmd_fd: Optional[int] = None
+        self._event_fd: Optional[int] = None
         self._available = False
         self._is_syncing = False
+        # State the tray menu currently shows; it starts at "Start Sync"
+        self._tray_syncing = False
         self._backend = None  # Will be set to 'sni', 'ayatana', or 'appindicator'
 
-        self._start_tray_process()
+        self._tray_handlers = {
+            OP_SHOW: self._on_tray_show,
+            OP_TOGGLE: self._on_tray_toggle_sync,
+            OP_SETTINGS: self._on_tray_settings,
+            OP_QUIT: self._on_tray_quit,
+        }
 
-    def _detect_tray_backend(self) -> Optional[str]:
-        """Detect the best available tray backend.
+        self._start_tray_process()
 
-        Returns:
-            Backend name ('sni', 'ayatana', 'appindicator') or None if unavailable
-        """
-        check_script = """import sys, os
-try:
-    from pydbus import SessionBus
-    bus = SessionBus()
-    for w in ["org.kde.StatusNotifierWatcher", "org.freedesktop.StatusNotifierWatcher"]:
-        try:
-            if bus.get(w).IsStatusNotifierHostRegistered: print("sni"); sys.exit(0)
-        except Exception: pass
-except Exception: pass
-if os.path.exists("/.flatpak-info"):
-    try: import pydbus; print("sni"); sys.exit(0)
-    except Exception: pass
-try:
-    import gi
-    try: gi.require_version('AyatanaAppIndicator3', '0.1'); from gi.repository import AyatanaAppIndicator3; print("ayatana"); sys.exit(0)
-    except Exception: pass
-    try: gi.require_version('AppIndicator3', '0.1'); from gi.repository import AppIndicator3; print("appindicator"); sys.exit(0)
-    except Exception: pass
-except Exception: pass
-print("none"); sys.exit(1)"""
+    def _start_tray_process(self):
+        """Adopt the tray process launched at import, or launch one now."""
         try:
-            result = subprocess.run(
-                [sys.executable, "-c", check_script],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            if result.returncode == 0:
-                return result.stdout.strip()
-            return None
+            launch = _take_tray_launch()
         except Exception as e:
-            print(f"Note: Could not detect tray backend: {e}")
-            return None
-
-    def _start_tray_process(self):
-        """Start the tray icon subprocess."""
-        backend = self._detect_tray_backend()
+            print(f"Warning: Could not start tray process: {e}")
+            return
 
-        if not backend:
+        if not launch:
             print("Note: System tray not available.")
             print("For tray support, install one of:")
             print("  - AppIndicator extension for GNOME")
@@ -132,305 +451,86 @@ print("none"); sys.exit(1)"""
             print("  - libappindicator-gtk3 (Arch)")
             return
 
-        self._backend = backend
-
-        if backend == "sni":
-            tray_script = self._generate_sni_script()
-        else:
-            tray_script = self._generate_appindicator_script(backend)
+        self._backend, self._pid, self._cmd_fd, self._event_fd = launch
 
         try:
-            self._process = subprocess.Popen(
-                [sys.executable, "-c", tray_script],
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=None,  # Inherit stderr for debugging
-                text=True,
-                bufsize=1,
-            )
-
-            # Start listener thread
-            self._listener_thread = threading.Thread(
-                target=self._listen_for_commands, daemon=True
+            # Tray events are read on the GTK main loop, no listener thread
+            self._event_watch_id = GLib.unix_fd_add_full(
+                GLib.PRIORITY_DEFAULT,
+                self._event_fd,
+                GLib.IOCondition.IN | GLib.IOCondition.HUP,
+                self._on_tray_event,
             )
-            self._listener_thread.start()
 
             self._available = True
-            print(f"Tray icon started using {backend} backend")
+            print(f"Tray icon started using {self._backend} backend")
 
         except Exception as e:
             print(f"Warning: Could not start tray process: {e}")
-            self._process = None
-
-    def _generate_sni_script(self) -> str:
-        """Generate Python script for D-Bus StatusNotifierItem backend.
-
-        This implements the org.kde.StatusNotifierItem D-Bus interface directly,
-        providing cross-desktop compatibility without GTK3 dependencies.
-        """
-        icon_path = APP_ICON_PATH
-        return f'''import sys, os, json, threading, gi
-gi.require_version('GdkPixbuf', '2.0')
-from pydbus import SessionBus
-from pydbus.generic import signal
-from gi.repository import GLib, GdkPixbuf
-
-SNI_INTERFACE = """<node><interface name="org.kde.StatusNotifierItem"><property name="Category" type="s" access="read"/><property name="Id" type="s" access="read"/><property name="Title" type="s" access="read"/><property name="Status" type="s" access="read"/><property name="IconName" type="s" access="read"/><property name="IconPixmap" type="a(iiay)" access="read"/><property name="AttentionIconName" type="s" access="read"/><property name="AttentionIconPixmap" type="a(iiay)" access="read"/><property name="ToolTip" type="(sa(iiay)ss)" access="read"/><property name="ItemIsMenu" type="b" access="read"/><property name="Menu" type="o" access="read"/><method name="ContextMenu"><arg name="x" type="i" direction="in"/><arg name="y" type="i" direction="in"/></method><method name="Activate"><arg name="x" type="i" direction="in"/><arg name="y" type="i" direction="in"/></method><method name="SecondaryActivate"><arg name="x" type="i" direction="in"/><arg name="y" type="i" direction="in"/></method><method name="Scroll"><arg name="delta" type="i" direction="in"/><arg name="orientation" type="s" direction="in"/></method><signal name="NewTitle"/><signal name="NewIcon"/><signal name="NewAttentionIcon"/><signal name="NewOverlayIcon"/><signal name="NewToolTip"/><signal name="NewStatus"><arg name="status" type="s"/></signal></interface></node>"""
-
-DBUSMENU_INTERFACE = """<node><interface name="com.canonical.dbusmenu"><property name="Version" type="u" access="read"/><property name="TextDirection" type="s" access="read"/><property name="Status" type="s" access="read"/><property name="IconThemePath" type="as" access="read"/><method name="GetLayout"><arg name="parentId" type="i" direction="in"/><arg name="recursionDepth" type="i" direction="in"/><arg name="propertyNames" type="as" direction="in"/><arg name="revision" type="u" direction="out"/><arg name="layout" type="(ia{{sv}}av)" direction="out"/></method><method name="GetGroupProperties"><arg name="ids" type="ai" direction="in"/><arg name="propertyNames" type="as" direction="in"/><arg name="properties" type="a(ia{{sv}})" direction="out"/></method><method name="GetProperty"><arg name="id" type="i" direction="in"/><arg name="name" type="s" direction="in"/><arg name="value" type="v" direction="out"/></method><method name="Event"><arg name="id" type="i" direction="in"/><arg name="eventId" type="s" direction="in"/><arg name="data" type="v" direction="in"/><arg name="timestamp" type="u" direction="in"/></method><method name="EventGroup"><arg name="events" type="a(isvu)" direction="in"/><arg name="idErrors" type="ai" direction="out"/></method><method name="AboutToShow"><arg name="id" type="i" direction="in"/><arg name="needUpdate" type="b" direction="out"/></method><method name="AboutToShowGroup"><arg name="ids" type="ai" direction="in"/><arg name="updatesNeeded" type="ai" direction="out"/><arg name="idErrors" type="ai" direction="out"/></method><signal name="ItemsPropertiesUpdated"><arg name="updatedProps" type="a(ia{{sv}})"/><arg name="removedProps" type="a(ias)"/></signal><signal name="LayoutUpdated"><arg name="revision" type="u"/><arg name="parent" type="i"/></signal><signal name="ItemActivationRequested"><arg name="id" type="i"/><arg name="timestamp" type="u"/></signal></interface></node>"""
-
-class DBusMenu:
-    dbus = DBUSMENU_INTERFACE
-    Version, TextDirection, Status, IconThemePath = 3, "ltr", "normal", []
-    
-    def __init__(self, on_click):
-        self.on_click, self.is_syncing, self._revision = on_click, False, 1
-    
-    def GetLayout(self, pId, depth, props):
-        sync_lbl = "Stop Sync" if self.is_syncing else "Start Sync"
-        children = [
-            (1, {{"label": GLib.Variant("s", "Show Lumux"), "visible": GLib.Variant("b", True)}}, []),
-            (2, {{"type": GLib.Variant("s", "separator"), "visible": GLib.Variant("b", True)}}, []),
-            (3, {{"label": GLib.Variant("s", sync_lbl), "visible": GLib.Variant("b", True)}}, []),
-            (4, {{"type": GLib.Variant("s", "separator"), "visible": GLib.Variant("b", True)}}, []),
-            (5, {{"label": GLib.Variant("s", "Settings"), "visible": GLib.Variant("b", True)}}, []),
-            (6, {{"type": GLib.Variant("s", "separator"), "visible": GLib.Variant("b", True)}}, []),
-            (7, {{"label": GLib.Variant("s", "Quit"), "visible": GLib.Variant("b", True)}}, []),
-        ]
-        return (self._revision, (0, {{"children-display": GLib.Variant("s", "submenu")}}, [GLib.Variant("(ia{{sv}}av)", c) for c in children]))
-    
-    def GetGroupProperties(self, ids, props):
-        res = []
-        for id in ids:
-            p = {{}}
-            if id == 1: p = {{"label": GLib.Variant("s", "Show Lumux")}}
-            elif id == 3: p = {{"label": GLib.Variant("s", "Stop Sync" if self.is_syncing else "Start Sync")}}
-            elif id == 5: p = {{"label": GLib.Variant("s", "Settings")}}
-            elif id == 7: p = {{"label": GLib.Variant("s", "Quit")}}
-            elif id in [2, 4, 6]: p = {{"type": GLib.Variant("s", "separator")}}
-            res.append((id, p))
-        return res
-    
-    def GetProperty(self, id, name): return GLib.Variant("s", "")
-    def Event(self, id, eid, data, ts):
-        if eid == "clicked": self.on_click(id)
-    def EventGroup(self, evs):
-        for e in evs:
-            if e[1] == "clicked": self.on_click(e[0])
-        return []
-    def AboutToShow(self, id): return False
-    def AboutToShowGroup(self, ids): return ([], [])
-    def update_sync(self, syncing):
-        self.is_syncing = syncing; self._revision += 1
-    
-    ItemsPropertiesUpdated = signal()
-    LayoutUpdated = signal()
-    ItemActivationRequested = signal()
-
-class StatusNotifierItem:
-    dbus = SNI_INTERFACE
-    Category, Id, Title = "ApplicationStatus", "io.github.enginkirmaci.lumux", "Lumux - Hue Screen Sync"
-    ItemIsMenu, Menu = False, "/MenuBar"
-    
-    def __init__(self, bus, menu, send):
-        self.bus, self.menu, self.send = bus, menu, send
-        self._status = "Active"
-        try:
-            pb = GdkPixbuf.Pixbuf.new_from_file_at_scale("{icon_path}", 22, 22, True)
-            w, h, rs, pixels = pb.get_width(), pb.get_height(), pb.get_rowstride(), pb.read_pixel_bytes().get_data()
-            argb = bytearray(w * h * 4)
-            for y in range(h):
-                for x in range(w):
-                    si, di = (y * rs) + (x * 4), (y * w * 4) + (x * 4)
-                    argb[di:di+4] = bytes([pixels[si+2], pixels[si+1], pixels[si], pixels[si+3]])
-            self._icon_pixmap = [(w, h, GLib.Variant("ay", bytes(argb)))]
-        except: self._icon_pixmap = []
+            self._pid = None
 
-    @property
-    def Status(self): return self._status
-    @property
-    def IconName(self): return "io.github.enginkirmaci.lumux"
-    @property
-    def IconPixmap(self): return self._icon_pixmap
-    @property
-    def AttentionIconName(self): return "io.github.enginkirmaci.lumux"
-    @property
-    def AttentionIconPixmap(self): return self._icon_pixmap
-    @property
-    def ToolTip(self): return ("io.github.enginkirmaci.lumux", self._icon_pixmap, "Lumux", "Hue Screen Sync")
-    
-    def ContextMenu(self, x, y): pass
-    def Activate(self, x, y): self.send({{"action": "show"}})
-    def SecondaryActivate(self, x, y): self.send({{"action": "toggle_sync"}})
-    def Scroll(self, d, o): pass
-    
-    NewTitle = signal(); NewIcon = signal(); NewAttentionIcon = signal(); NewOverlayIcon = signal(); NewToolTip = signal(); NewStatus = signal()
-
-class TrayApp:
-    def __init__(self):
-        self.loop = GLib.MainLoop()
-        self.bus = SessionBus()
-        self.menu = DBusMenu(self.on_click)
-        self.sni = StatusNotifierItem(self.bus, self.menu, self.send)
-        import random; self.svc = f"io.github.enginkirmaci.lumux.Tray"
-        try: self.bus.publish(self.svc, ("/StatusNotifierItem", self.sni), ("/MenuBar", self.menu))
-        except: sys.exit(1)
-        
-        for w in ["org.kde.StatusNotifierWatcher", "org.freedesktop.StatusNotifierWatcher"]:
-            try: self.bus.get(w, "/StatusNotifierWatcher").RegisterStatusNotifierItem(self.svc); break
-            except: pass
-            
-        threading.Thread(target=self.listen, daemon=True).start()
-    
-    def on_click(self, id):
-        acts = {{1: "show", 3: "toggle_sync", 5: "settings", 7: "quit"}}
-        if id in acts:
-            self.send({{"action": acts[id]}})
-            if id == 7: self.loop.quit()
-
-    def listen(self):
+    def _on_tray_event(self, fd: int, condition) -> bool:
+        """Read and dispatch opcodes sent by the tray subprocess."""
         try:
-            for l in sys.stdin:
-                if l := l.strip():
-                    try: GLib.idle_add(self.handle, json.loads(l))
-                    except: pass
-        except: GLib.idle_add(self.loop.quit)
-
-    def handle(self, cmd):
-        if cmd.get("action") == "quit": self.loop.quit()
-        elif cmd.get("action") == "update_sync":
-            self.menu.update_sync(cmd.get("is_syncing", False))
-            self.menu.LayoutUpdated.emit(self.menu._revision, 0)
-        return False
-
-    def send(self, cmd): print(json.dumps(cmd), flush=True)
-    def run(self): self.loop.run()
-
-if __name__ == "__main__":
-    try: TrayApp().run()
-    except: sys.exit(1)
-'''
-
-    def _generate_appindicator_script(self, indicator_type: str) -> str:
-        """Generate Python script for AppIndicator backend.
-
-        This is the fallback for systems without SNI support but with AppIndicator.
+            data = os.read(fd, READ_SIZE)
+        except BlockingIOError:
+            # Spurious wakeup; the main loop must never wait on the tray
+            return True
+        except OSError:
+            data = b""
+
+        if not data:
+            # HUP/EOF: the tray process exited, so there is no icon to
+            # restore a hidden window from any more
+            print("Warning: Tray process exited; tray icon unavailable")
+            self._available = False
+            self._close_event_pipe()
+            return False
+
+        for op, _arg in FRAME.iter_unpack(data):
+            self._handle_tray_command(op)
+        return True
+
+    def _close_event_pipe(self):
+        """Stop watching and close the tray-to-app pipe."""
+        self._event_watch_id = 0
+        if self._event_fd is not None:
+            os.close(self._event_fd)
+            self._event_fd = None
+
+    def _handle_tray_command(self, op: int):
+        """Handle an opcode from the tray subprocess."""
+        if handler := self._tray_handlers.get(op):
+            handler()
+
+    def _on_tray_show(self):
+        if self.main_window:
+            self.main_window.present()
+
+    def _on_tray_toggle_sync(self):
+        if self.main_window:
+            self.main_window._on_sync_toggle(None)
+
+    def _on_tray_settings(self):
+        if self.main_window:
+            self.main_window.present()
+            self.main_window._on_settings_clicked(None)
+
+    def _on_tray_quit(self):
+        if self.app:
+            self.app.quit()
+
+    def _send_to_tray(self, frame: bytes):
+        """Send a prebuilt protocol frame to the tray subprocess.
+
+        Frames are written unbuffered in one syscall. If the tray has
+        stopped reading and the pipe is full the frame is dropped; quit is
+        still delivered by closing the pipe.
         """
-        icon_value = (
-            APP_ICON_PATH
-            if os.path.exists(APP_ICON_PATH)
-            else "io.github.enginkirmaci.lumux"
-        )
-
-        return f'''import sys, json, threading, gi
-gi.require_version('Gtk', '3.0')
-if "{indicator_type}" == "ayatana":
-    gi.require_version('AyatanaAppIndicator3', '0.1')
-    from gi.repository import AyatanaAppIndicator3 as AppIndicator
-else:
-    gi.require_version('AppIndicator3', '0.1')
-    from gi.repository import AppIndicator3 as AppIndicator
-
-from gi.repository import Gtk, GLib
-
-class TrayApp:
-    def __init__(self):
-        self.is_syncing = False
-        self.ind = AppIndicator.Indicator.new("io.github.enginkirmaci.lumux", "{icon_value}", AppIndicator.IndicatorCategory.APPLICATION_STATUS)
-        self.ind.set_status(AppIndicator.IndicatorStatus.ACTIVE)
-        self.ind.set_title("Lumux - Hue Screen Sync")
-        self.menu = Gtk.Menu()
-        
-        def add(lbl, cb=None):
-            i = Gtk.MenuItem(label=lbl)
-            if cb: i.connect("activate", cb)
-            self.menu.append(i); return i
-            
-        add("Show Lumux", lambda w: self.send({{"action": "show"}}))
-        self.menu.append(Gtk.SeparatorMenuItem())
-        self.sync_item = add("Start Sync", lambda w: self.send({{"action": "toggle_sync"}}))
-        self.menu.append(Gtk.SeparatorMenuItem())
-        add("Settings", lambda w: self.send({{"action": "settings"}}))
-        self.menu.append(Gtk.SeparatorMenuItem())
-        add("Quit", lambda w: (self.send({{"action": "quit"}}), Gtk.main_quit()))
-        
-        self.menu.show_all()
-        self.ind.set_menu(self.menu)
-        threading.Thread(target=self.listen, daemon=True).start()
-    
-    def listen(self):
-        try:
-            for l in sys.stdin:
-                if l := l.strip():
-                    try: GLib.idle_add(self.handle, json.loads(l))
-                    except: pass
-        except: GLib.idle_add(Gtk.main_quit)
-    
-    def handle(self, cmd):
-        if cmd.get("action") == "quit": Gtk.main_quit()
-        elif cmd.get("action") == "update_sync":
-            self.is_syncing = cmd.get("is_syncing", False)
-            self.sync_item.set_label("Stop Sync" if self.is_syncing else "Start Sync")
-        return False
-    
-    def send(self, cmd): print(json.dumps(cmd), flush=True)
-
-if __name__ == "__main__":
-    TrayApp()
-    Gtk.main()
-'''
-
-    def _listen_for_commands(self):
-        """Listen for commands from the tray subprocess."""
-        if not self._process or not self._process.stdout:
-            return
-
-        try:
-            for line in self._process.stdout:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    cmd = json.loads(line)
-                    self._handle_tray_command(cmd)
-                except json.JSONDecodeError:
-                    pass
-        except Exception:
-            pass
-
-    def _handle_tray_command(self, cmd: dict):
-        """Handle command from tray subprocess."""
-
-        def _show():
-            if self.main_window:
-                self.main_window.present()
-
-        def _sync():
-            if self.main_window:
-                self.main_window._on_sync_toggle(None)
-
-        def _settings():
-            if self.main_window:
-                self.main_window.present()
-                self.main_window._on_settings_clicked(None)
-
-        handlers = {
-            "show": _show,
-            "toggle_sync": _sync,
-            "settings": _settings,
-            "quit": lambda: self.app.quit() if self.app else None,
-        }
-
-        if handler := handlers.get(cmd.get("action")):
-            GLib.idle_add(handler)
-
-    def _send_to_tray(self, cmd: dict):
-        """Send command to tray subprocess."""
-        if self._process and self._process.stdin:
+        if self._cmd_fd is not None:
             try:
-                self._process.stdin.write(json.dumps(cmd) + "\n")
-                self._process.stdin.flush()
-            except Exception:
+                os.write(self._cmd_fd, frame)
+            except (BrokenPipeError, BlockingIOError):
                 pass
 
     def update_sync_status(self, is_syncing: bool):
@@ -440,7 +540,18 @@ if __name__ == "__main__":
             is_syncing: Whether sync is currently active
         """
         self._is_syncing = is_syncing
-        self._send_to_tray({"action": "update_sync", "is_syncing": is_syncing})
+        # Coalesce bursts of toggles; only the state after 50 ms is sent
+        if not self._sync_timer_id:
+            self._sync_timer_id = GLib.timeout_add(50, self._flush_sync_status)
+
+    def _flush_sync_status(self) -> bool:
+        """Send the latest sync state to the tray subprocess."""
+        self._sync_timer_id = 0
+        # A burst that ends where it started needs no write at all
+        if self._is_syncing != self._tray_syncing:
+            self._tray_syncing = self._is_syncing
+            self._send_to_tray(SYNC_FRAMES[bool(self._is_syncing)])
+        return False
 
     @property
     def is_available(self) -> bool:
@@ -454,32 +565,28 @@ if __name__ == "__main__":
 
     def destroy(self):
         """Clean up the tray icon."""
-        if self._process:
+        if self._sync_timer_id:
+            GLib.source_remove(self._sync_timer_id)
+            self._sync_timer_id = 0
+        if self._event_watch_id:
+            GLib.source_remove(self._event_watch_id)
+        self._close_event_pipe()
+
+        if self._pid:
             try:
                 # Try to send quit command first
-                self._send_to_tray({"action": "quit"})
+                self._send_to_tray(QUIT_FRAME)
             except Exception:
                 pass
 
-            try:
-                # Close stdin to prevent BrokenPipeError
-                if self._process.stdin:
-                    self._process.stdin.close()
-            except Exception:
-                pass
+            # Close the command pipe; the tray also quits on its EOF
+            if self._cmd_fd is not None:
+                os.close(self._cmd_fd)
+                self._cmd_fd = None
 
-            try:
-                # Wait for graceful shutdown
-                self._process.wait(timeout=2)
-            except Exception:
-                # Force kill if it doesn't exit gracefully
-                try:
-                    self._process.terminate()
-                    self._process.wait(timeout=1)
-                except Exception:
-                    try:
-                        self._process.kill()
-                    except Exception:
-                        pass
+            # Reap off the GUI thread so closing the window never blocks
+            threading.Thread(
+                target=_reap_tray_process, args=(self._pid,), daemon=True
+            ).start()
 
-            self._process = None
+            self._pid = None
@@ -1,5 +1,7 @@
 """Zone preview widget with modern styling."""
 
+from typing import Dict, List, Tuple
+
 import gi
 
 gi.require_version("Gtk", "4.0")
@@ -15,8 +17,17 @@ class ZonePreviewWidget(Gtk.DrawingArea):
         self.rows = rows
         self.cols = cols
         self.zone_colors: dict = {}
-        self._prev_zone_colors: dict = {}
         self._cell_gap = 2
+        # Static background and monitor, re-rendered only when resized
+        self._chrome_surface = None
+        self._chrome_size = (0, 0)
+        # Zone cell rectangles for the current layout and size
+        self._zone_rects = None
+        self._zone_rects_size = (0, 0)
+        # Outline of every cell, replayed each frame
+        self._border_path = None
+        # Cell gradients keyed by (rgb, y, h)
+        self._pattern_cache: Dict[tuple, cairo.LinearGradient] = {}
 
         self.set_size_request(400, 300)
         self.set_draw_func(self._draw)
@@ -31,6 +42,7 @@ class ZonePreviewWidget(Gtk.DrawingArea):
         self.rows = rows
         self.cols = cols
         self.zone_colors = {}
+        self._zone_rects = None
         self.queue_draw()
 
     def update_colors(self, zone_colors: dict):
@@ -39,45 +51,94 @@ class ZonePreviewWidget(Gtk.DrawingArea):
         Args:
             zone_colors: Dictionary mapping zone IDs to RGB tuples
         """
-        if zone_colors == self._prev_zone_colors:
+        # Dict equality is a C-level walk that stops at the first
+        # difference, cheaper and exact compared to hashing every frame
+        if zone_colors == self.zone_colors:
             return
-        self._prev_zone_colors = zone_colors.copy()
+        # Each frame is a fresh dict from the sync thread that is never
+        # mutated afterwards, so it is kept without copying
         self.zone_colors = zone_colors
         self.queue_draw()
 
     def _draw(self, widget, ctx, width, height):
         """Draw zone grid with current colors."""
-        # Draw background (rectangular)
-        ctx.rectangle(0, 0, width, height)
-        ctx.set_source_rgb(0.08, 0.08, 0.08)
-        ctx.fill()
+        if self._chrome_surface is None or self._chrome_size != (width, height):
+            # Similar to the target so it stays sharp on scaled displays
+            self._chrome_surface = ctx.get_target().create_similar(
+                cairo.CONTENT_COLOR_ALPHA, width, height
+            )
+            self._draw_chrome(cairo.Context(self._chrome_surface), width, height)
+            self._chrome_size = (width, height)
 
-        self._draw_ambilight(ctx, width, height)
+        ctx.set_source_surface(self._chrome_surface, 0, 0)
+        ctx.paint()
 
-    def _draw_cell(self, ctx, x, y, w, h, rgb):
-        """Draw a single cell with optional glow effect."""
-        r, g, b = rgb[0] / 255, rgb[1] / 255, rgb[2] / 255
+        self._draw_ambilight(ctx, width, height)
 
-        # Main cell fill with gradient
-        pattern = cairo.LinearGradient(x, y, x, y + h)
-        pattern.add_color_stop_rgb(0, min(1, r * 1.2), min(1, g * 1.2), min(1, b * 1.2))
-        pattern.add_color_stop_rgb(1, r * 0.85, g * 0.85, b * 0.85)
+    def _cell_pattern(self, rgb, y, h) -> cairo.LinearGradient:
+        """Return the vertical gradient for a cell color and row band."""
+        # The gradient is vertical, so cells sharing a color and row band
+        # (and a cell whose color holds between frames) reuse one pattern
+        key = (rgb, y, h)
+        pattern = self._pattern_cache.get(key)
+        if pattern is None:
+            r, g, b = rgb[0] / 255, rgb[1] / 255, rgb[2] / 255
+
+            pattern = cairo.LinearGradient(0, y, 0, y + h)
+            pattern.add_color_stop_rgb(
+                0, min(1, r * 1.2), min(1, g * 1.2), min(1, b * 1.2)
+            )
+            pattern.add_color_stop_rgb(1, r * 0.85, g * 0.85, b * 0.85)
 
-        ctx.rectangle(x, y, w, h)
-        ctx.set_source(pattern)
-        ctx.fill()
+            if len(self._pattern_cache) >= 4 * len(self._zone_rects):
+                # Drop the oldest pattern; dicts keep insertion order
+                del self._pattern_cache[next(iter(self._pattern_cache))]
+            self._pattern_cache[key] = pattern
+        return pattern
 
-        # Subtle border
+    def _draw_ambilight(self, ctx, width, height):
+        """Draw ambilight layout with modern styling."""
+        if self._zone_rects is None or self._zone_rects_size != (width, height):
+            self._zone_rects = self._layout_zones(width, height)
+            self._pattern_cache.clear()
+            self._border_path = None
+            self._zone_rects_size = (width, height)
+
+        # Group cells that paint with the same gradient so each group is
+        # one path and one fill; whole edges often share a color
+        groups: Dict[tuple, list] = {}
+        zone_colors = self.zone_colors
+        for zone_id, x, y, w, h in self._zone_rects:
+            rgb = zone_colors.get(zone_id, (30, 30, 30))
+            groups.setdefault((rgb, y, h), []).append((x, w))
+
+        for (rgb, y, h), cells in groups.items():
+            for x, w in cells:
+                ctx.rectangle(x, y, w, h)
+            ctx.set_source(self._cell_pattern(rgb, y, h))
+            ctx.fill()
+
+        # Subtle border: every outline is one cached path and one stroke
+        if self._border_path is None:
+            for _zone_id, x, y, w, h in self._zone_rects:
+                ctx.rectangle(x, y, w, h)
+            self._border_path = ctx.copy_path()
+        else:
+            ctx.append_path(self._border_path)
         ctx.set_source_rgba(1, 1, 1, 0.1)
-        ctx.rectangle(x, y, w, h)
         ctx.set_line_width(0.5)
         ctx.stroke()
 
-    def _draw_ambilight(self, ctx, width, height):
-        """Draw ambilight layout with modern styling."""
+    def _layout_zones(
+        self, width, height
+    ) -> List[Tuple[str, float, float, float, float]]:
+        """Compute the cell rectangle of every ambilight zone.
+
+        Returns:
+            List of (zone_id, x, y, w, h) in top, bottom, left, right order
+        """
         edge_thickness = min(36, height // 6)
         inner_padding = 4
-        inner_width = width - 2 * edge_thickness - 2 * inner_padding
         inner_height = height - 2 * edge_thickness - 2 * inner_padding
 
         top_count = self.cols
@@ -95,57 +156,44 @@ class ZonePreviewWidget(Gtk.DrawingArea):
             inner_height - (right_count - 1) * self._cell_gap
         ) / right_count
 
-        # Draw top zones
-        for i in range(top_count):
-            zone_id = f"top_{i}"
-            rgb = self.zone_colors.get(zone_id, (30, 30, 30))
+        edge_h = edge_thickness - self._cell_gap
+        rects = []
 
+        for i in range(top_count):
             x = self._cell_gap + i * (top_zone_width + self._cell_gap)
-            y = self._cell_gap
-            w = top_zone_width
-            h = edge_thickness - self._cell_gap
-
-            self._draw_cell(ctx, x, y, w, h, rgb)
+            rects.append((f"top_{i}", x, self._cell_gap, top_zone_width, edge_h))
 
-        # Draw bottom zones
         for i in range(bottom_count):
-            zone_id = f"bottom_{i}"
-            rgb = self.zone_colors.get(zone_id, (30, 30, 30))
-
             x = self._cell_gap + i * (bottom_zone_width + self._cell_gap)
             y = height - edge_thickness
-            w = bottom_zone_width
-            h = edge_thickness - self._cell_gap
-
-            self._draw_cell(ctx, x, y, w, h, rgb)
+            rects.append((f"bottom_{i}", x, y, bottom_zone_width, edge_h))
 
-        # Draw left zones
         for i in range(left_count):
-            zone_id = f"left_{i}"
-            rgb = self.zone_colors.get(zone_id, (30, 30, 30))
-
-            x = self._cell_gap
             y = edge_thickness + inner_padding + i * (left_zone_height + self._cell_gap)
-            w = edge_thickness - self._cell_gap
-            h = left_zone_height
-
-            self._draw_cell(ctx, x, y, w, h, rgb)
+            rects.append((f"left_{i}", self._cell_gap, y, edge_h, left_zone_height))
 
-        # Draw right zones
         for i in range(right_count):
-            zone_id = f"right_{i}"
-            rgb = self.zone_colors.get(zone_id, (30, 30, 30))
-
             x = width - edge_thickness
             y = (
                 edge_thickness
                 + inner_padding
                 + i * (right_zone_height + self._cell_gap)
             )
-            w = edge_thickness - self._cell_gap
-            h = right_zone_height
+            rects.append((f"right_{i}", x, y, edge_h, right_zone_height))
+
+        return rects
 
-            self._draw_cell(ctx, x, y, w, h, rgb)
+    def _draw_chrome(self, ctx, width, height):
+        """Draw the background and monitor, which don't depend on colors."""
+        edge_thickness = min(36, height // 6)
+        inner_padding = 4
+        inner_width = width - 2 * edge_thickness - 2 * inner_padding
+        inner_height = height - 2 * edge_thickness - 2 * inner_padding
+
+        # Draw background (rectangular)
+        ctx.rectangle(0, 0, width, height)
+        ctx.set_source_rgb(0.08, 0.08, 0.08)
+        ctx.fill()
 
         # Draw inner "screen" area with monitor bezel effect
         screen_x = edge_thickness + inner_padding
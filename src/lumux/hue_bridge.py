@@ -4,22 +4,51 @@ Refactored to use unified BridgeClient instead of python-hue-v2.
 """
 
 import json
+import os
+import selectors
 import socket
+import threading
 import time
 import urllib.error
 import urllib.request
-from typing import Dict, List, Optional
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from lumux.bridge_client import BridgeClient, BridgeError
 from lumux.utils.logging import timed_print
 
 
+def _index_by_id(items: Any) -> Dict[str, dict]:
+    """Index bridge resources by ID.
+
+    Args:
+        items: Resource list from the v2 API, or a dict already keyed by ID
+
+    Returns:
+        Dict mapping resource ID to resource, skipping entries without one
+    """
+    if isinstance(items, dict):
+        return {str(key): value for key, value in items.items()}
+    return {item_id: item for item in items if (item_id := item.get('id'))}
+
+
 class HueBridge:
     """High-level interface to Philips Hue Bridge.
     
     Manages connection state, device caching, and provides
     convenient methods for light/zone control.
     """
+
+    # Device topology and light positions change on the order of minutes
+    # to hours, so they are re-fetched at most this often (seconds)
+    METADATA_MAX_AGE = 300.0
+
+    # Light positions saved on disk are used at startup for at most this
+    # long (seconds); a fresh copy is always fetched in the background
+    SPATIAL_CACHE_MAX_AGE = 7 * 24 * 3600.0
+
+    # Once a bridge answers SSDP, keep listening this long for others (seconds)
+    SSDP_RESPONSE_GRACE = 0.3
     
     def __init__(self, bridge_ip: str, app_key: str):
         """Initialize bridge connection.
@@ -37,25 +66,71 @@ class HueBridge:
         self.zones: Dict[str, dict] = {}
         self.light_info: Dict[str, dict] = {}
 
+        # (bridge_ip, endpoint) -> (time.monotonic() of fetch, response data)
+        self._metadata_cache: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+        # (bridge_ip, time.monotonic()) of the last full device refresh
+        self._last_refresh: Optional[Tuple[str, float]] = None
+        # Background re-fetch of spatial data started by connect()
+        self._spatial_refresh_thread: Optional[threading.Thread] = None
+        # Serializes spatial refreshes and the cache file they write
+        self._spatial_lock = threading.Lock()
+
     @property
     def client(self) -> Optional[BridgeClient]:
-        """Get or create bridge client."""
-        if self._client is None and self.bridge_ip and self.app_key:
-            self._client = BridgeClient(self.bridge_ip, self.app_key)
-        return self._client
+        """Get or create bridge client.
+
+        The client and its pooled connection are reused until the bridge
+        IP or app key changes.
+        """
+        client = self._client
+        if client is not None and (
+            client.bridge_ip != self.bridge_ip or client.app_key != self.app_key
+        ):
+            client.close()
+            client = self._client = None
+        if client is None and self.bridge_ip and self.app_key:
+            client = self._client = BridgeClient(self.bridge_ip, self.app_key)
+        return client
 
     def connect(self) -> bool:
         """Connect to Hue bridge using existing credentials."""
         if not self.bridge_ip or not self.app_key:
             return False
         
+        # Positions already in memory, or saved by an earlier run, spare the
+        # device and entertainment configuration round trips on this path
+        have_spatial = self._has_spatial_data() or self._load_spatial_cache()
         try:
-            self.refresh_devices()
-            return True
+            self.refresh_devices(force=True, spatial_force=not have_spatial)
         except BridgeError as e:
             print(f"Error connecting to bridge: {e}")
             return False
 
+        if have_spatial:
+            self._start_spatial_refresh()
+        return True
+
+    def _has_spatial_data(self) -> bool:
+        """Check if spatial data for the current bridge is cached in memory."""
+        return all(
+            (self.bridge_ip, endpoint) in self._metadata_cache
+            for endpoint in ("device", "entertainment_configuration")
+        )
+
+    def _start_spatial_refresh(self):
+        """Re-fetch spatial data in the background unless already doing so."""
+        thread = self._spatial_refresh_thread
+        if thread is not None and thread.is_alive():
+            return
+        thread = threading.Thread(
+            target=self._refresh_spatial_data,
+            kwargs={"force": True},
+            daemon=True,
+            name="SpatialRefresh",
+        )
+        self._spatial_refresh_thread = thread
+        thread.start()
+
     def create_user(self, bridge_ip: str, application_name: str = "lumux",
                    max_retries: int = 3, timeout: float = 10.0) -> Optional[dict]:
         """Create a new user/app key on the bridge.
@@ -83,15 +158,69 @@ class HueBridge:
             print(f"Error creating user: {e}")
             return None
 
-    def refresh_devices(self):
-        """Fetch all lights, zones, and entertainment configs from bridge."""
+    def _cached_fetch(
+        self,
+        endpoint: str,
+        fetch: Callable[[], Any],
+        force: bool = False,
+        bridge_ip: Optional[str] = None,
+    ) -> Any:
+        """Return bridge metadata, re-fetching it only once it is stale.
+
+        If the bridge can't be reached, the last fetched copy is returned
+        rather than failing.
+
+        Args:
+            endpoint: Cache key for the resource, e.g. 'device'
+            fetch: Callable fetching the resource from the bridge
+            force: Ignore the cached copy and fetch from the bridge
+            bridge_ip: Bridge the data belongs to; defaults to the current one
+
+        Raises:
+            BridgeError: If fetching fails and nothing is cached
+        """
+        key = (bridge_ip or self.bridge_ip, endpoint)
+        cached = self._metadata_cache.get(key)
+        now = time.monotonic()
+        if not force and cached and now - cached[0] < self.METADATA_MAX_AGE:
+            return cached[1]
+
+        try:
+            data = fetch()
+        except BridgeError as e:
+            if cached is None:
+                raise
+            print(f"Using cached bridge {endpoint} data: {e}")
+            return cached[1]
+
+        self._metadata_cache[key] = (now, data)
+        return data
+
+    def refresh_devices(
+        self, force: bool = False, spatial_force: Optional[bool] = None
+    ):
+        """Fetch all lights, zones, and entertainment configs from bridge.
+
+        Args:
+            force: Refresh even if the last refresh is still recent
+            spatial_force: Re-fetch devices and entertainment configs even
+                if cached; defaults to force
+        """
         if not self.client:
             return
 
+        last = self._last_refresh
+        if (
+            not force
+            and last is not None
+            and last[0] == self.bridge_ip
+            and time.monotonic() - last[1] < self.METADATA_MAX_AGE
+        ):
+            return
+
         try:
             # Fetch lights
-            lights = self.client.get_lights()
-            self.lights = {light.get('id'): light for light in lights if light.get('id')}
+            self.lights = _index_by_id(self.client.get_lights())
             
             # Build light info cache
             self.light_info = {}
@@ -115,36 +244,75 @@ class HueBridge:
                 }
 
             # Fetch spatial data from entertainment configurations
-            self._refresh_spatial_data()
+            self._refresh_spatial_data(
+                force=force if spatial_force is None else spatial_force
+            )
 
             # Fetch zones
-            zones = self.client.get_zones()
-            self.zones = {zone.get('id'): zone for zone in zones if zone.get('id')}
+            self.zones = _index_by_id(self.client.get_zones())
+
+            self._last_refresh = (self.bridge_ip, time.monotonic())
 
         except BridgeError as e:
             print(f"Error refreshing devices: {e}")
 
-    def _refresh_spatial_data(self):
-        """Fetch and map spatial positions from entertainment configurations."""
-        if not self.client:
+    def _refresh_spatial_data(self, force: bool = False):
+        """Fetch and map spatial positions from entertainment configurations.
+
+        Args:
+            force: Re-fetch devices and configurations even if cached
+        """
+        client = self.client
+        if not client:
             return
 
+        # The bridge IP may change while this runs on a background thread,
+        # so everything below sticks to the bridge it started with
+        bridge_ip = client.bridge_ip
+        with self._spatial_lock:
+            self._refresh_spatial_data_locked(client, bridge_ip, force)
+
+    def _refresh_spatial_data_locked(
+        self, client: BridgeClient, bridge_ip: str, force: bool
+    ):
+        """Fetch and map spatial positions for one bridge; needs _spatial_lock."""
+        started = time.monotonic()
         try:
             # 1. Get devices to map light service IDs to entertainment service IDs
-            devices = self.client.get_devices()
+            devices = self._cached_fetch(
+                "device", client.get_devices, force, bridge_ip
+            )
             
-            service_map: Dict[str, str] = {}  # light_rid -> entertainment_rid
+            # entertainment_rid -> light_rids, keyed the way locations look it up
+            ent_to_lights: Dict[str, List[str]] = {}
             for device in devices:
                 services = device.get('services', [])
                 light_rids = [s['rid'] for s in services if s.get('rtype') == 'light']
                 ent_rids = [s['rid'] for s in services if s.get('rtype') == 'entertainment']
                 if light_rids and ent_rids:
-                    for light_rid in light_rids:
-                        service_map[light_rid] = ent_rids[0]
+                    ent_to_lights.setdefault(ent_rids[0], []).extend(light_rids)
 
             # 2. Get entertainment configurations
-            ent_configs = self.client.get_entertainment_configurations()
-            
+            ent_configs = self._cached_fetch(
+                "entertainment_configuration",
+                client.get_entertainment_configurations,
+                force,
+                bridge_ip,
+            )
+
+            entries = [
+                self._metadata_cache.get((bridge_ip, endpoint))
+                for endpoint in ("device", "entertainment_configuration")
+            ]
+            if any(entry and entry[0] >= started for entry in entries):
+                self._save_spatial_cache(
+                    devices, ent_configs, self._spatial_cache_path(bridge_ip)
+                )
+
+            if self.bridge_ip != bridge_ip:
+                print("Bridge changed during spatial refresh; positions discarded.")
+                return
+
             found_count = 0
             for config in ent_configs:
                 locations = config.get('locations', {}).get('service_locations', [])
@@ -155,8 +323,8 @@ class HueBridge:
                         continue
                     
                     # Find light_id for this entertainment_rid
-                    for light_rid, mapped_ent_rid in service_map.items():
-                        if mapped_ent_rid == ent_rid and light_rid in self.light_info:
+                    for light_rid in ent_to_lights.get(ent_rid, ()):
+                        if light_rid in self.light_info:
                             self.light_info[light_rid]['position'] = position
                             found_count += 1
             
@@ -164,10 +332,72 @@ class HueBridge:
                 print(f"Spatial data refreshed: Found positions for {found_count} lights.")
             else:
                 print("Spatial data refreshed: No light positions found in entertainment zones.")
-            
+
         except BridgeError as e:
             print(f"Error refreshing spatial data: {e}")
 
+    def _spatial_cache_path(self, bridge_ip: Optional[str] = None) -> Path:
+        """Get the on-disk spatial data cache file for a bridge.
+
+        Args:
+            bridge_ip: Bridge IP address; defaults to the current bridge
+        """
+        xdg_cache = os.environ.get("XDG_CACHE_HOME")
+        cache_dir = Path(xdg_cache) if xdg_cache else Path.home() / ".cache"
+        return cache_dir / "lumux" / f"spatial-{bridge_ip or self.bridge_ip}.json"
+
+    def _load_spatial_cache(self) -> bool:
+        """Seed device and entertainment config data saved by an earlier run.
+
+        Returns:
+            True if recent enough data was found and loaded
+        """
+        path = self._spatial_cache_path()
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+            age = time.time() - data["ts"]
+            devices = data["device"]
+            ent_configs = data["entertainment_configuration"]
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"Ignoring unreadable spatial cache {path}: {e}")
+            return False
+
+        if not 0 <= age < self.SPATIAL_CACHE_MAX_AGE:
+            return False
+
+        now = time.monotonic()
+        self._metadata_cache[(self.bridge_ip, "device")] = (now, devices)
+        self._metadata_cache[(self.bridge_ip, "entertainment_configuration")] = (
+            now,
+            ent_configs,
+        )
+        return True
+
+    def _save_spatial_cache(self, devices: Any, ent_configs: Any, path: Path):
+        """Save freshly fetched spatial data for the next startup.
+
+        Args:
+            devices: Device list from the bridge
+            ent_configs: Entertainment configurations from the bridge
+            path: Cache file of the bridge the data was fetched from
+        """
+        data = {
+            "ts": time.time(),
+            "device": devices,
+            "entertainment_configuration": ent_configs,
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Could not save spatial cache: {e}")
+
     def set_light_color(
         self, 
         light_id: str, 
@@ -244,6 +474,49 @@ class HueBridge:
         except BridgeError as e:
             print(f"Error setting zone color: {e}")
 
+    def set_grouped_light_color(
+        self,
+        group_id: str,
+        xy: tuple,
+        brightness: int,
+        transition_time: int = 100
+    ):
+        """Set color and brightness of every light in a bridge zone at once.
+
+        Args:
+            group_id: Grouped light ID from get_light_groups()
+            xy: Tuple of (x, y) coordinates
+            brightness: Brightness value (0-254)
+            transition_time: Transition time in milliseconds
+        """
+        if not self.client:
+            return
+
+        try:
+            if self.client.set_grouped_light_color(group_id, xy, brightness, transition_time):
+                timed_print(f"Set group {group_id} color to xy={xy}, brightness={brightness}")
+        except BridgeError as e:
+            print(f"Error setting grouped light color: {e}")
+
+    def get_light_groups(self) -> Dict[str, Set[str]]:
+        """Get the lights each bridge zone's grouped light controls.
+
+        Returns:
+            Mapping of grouped light ID to the set of its light IDs
+        """
+        groups: Dict[str, Set[str]] = {}
+        for zone in self.zones.values():
+            light_ids = {
+                child['rid'] for child in zone.get('children', [])
+                if child.get('rtype') == 'light' and child.get('rid')
+            }
+            if not light_ids:
+                continue
+            for service in zone.get('services', []):
+                if service.get('rtype') == 'grouped_light' and service.get('rid'):
+                    groups[service['rid']] = light_ids
+        return groups
+
     def get_light_ids(self) -> List[str]:
         """Get list of all light IDs."""
         return list(self.lights.keys())
@@ -346,36 +619,48 @@ class HueBridge:
         bridges = []
 
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            sock.settimeout(timeout)
-
-            ssdp_request = (
-                b"M-SEARCH * HTTP/1.1\r\n"
-                b"HOST: 239.255.255.250:1900\r\n"
-                b"MAN: \"ssdp:discover\"\r\n"
-                b"MX: 3\r\n"
-                b"ST: ssdp:all\r\n"
-                b"\r\n"
-            )
-
-            sock.sendto(ssdp_request, ("239.255.255.250", 1900))
-
-            # Collect responses until timeout
-            start_time = time.time()
-            while time.time() - start_time < timeout:
-                try:
-                    data, addr = sock.recvfrom(1024)
-                    response = data.decode('utf-8', errors='ignore')
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock, \
+                    selectors.DefaultSelector() as sel:
+                sock.setblocking(False)
+                sel.register(sock, selectors.EVENT_READ)
+
+                ssdp_request = (
+                    b"M-SEARCH * HTTP/1.1\r\n"
+                    b"HOST: 239.255.255.250:1900\r\n"
+                    b"MAN: \"ssdp:discover\"\r\n"
+                    b"MX: 3\r\n"
+                    b"ST: ssdp:all\r\n"
+                    b"\r\n"
+                )
+
+                # Send twice since UDP multicast may drop a single request
+                sock.sendto(ssdp_request, ("239.255.255.250", 1900))
+                time.sleep(0.05)
+                sock.sendto(ssdp_request, ("239.255.255.250", 1900))
+
+                # Collect responses until the deadline, which is pulled in
+                # once a bridge has answered so discovery needn't wait it out
+                deadline = time.monotonic() + timeout
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    if not sel.select(timeout=remaining):
+                        continue
+                    try:
+                        data, addr = sock.recvfrom(1500)
+                    except BlockingIOError:
+                        continue
+                    response = data.decode('utf-8', errors='ignore').lower()
 
-                    if "hue-bridgeid" in response.lower() or "phillips-hue" in response.lower():
+                    if "hue-bridgeid" in response or "phillips-hue" in response:
                         ip_address = addr[0]
                         if ip_address not in bridges:
                             bridges.append(ip_address)
                             print(f"SSDP found bridge at {ip_address}")
-                except socket.timeout:
-                    break
-
-            sock.close()
+                        deadline = min(
+                            deadline, time.monotonic() + cls.SSDP_RESPONSE_GRACE
+                        )
         except Exception as e:
             print(f"SSDP discovery error: {e}")
 
@@ -553,7 +838,7 @@ class HueBridge:
 
             # Resolve: any device that exposes one of the config's service RIDs
             # contributes its light service RIDs to the zone.
-            devices = self.client.get_devices()
+            devices = self._cached_fetch("device", self.client.get_devices)
             light_ids: List[str] = []
             seen: set = set()
             for device in devices:
@@ -5,7 +5,8 @@ reading mode sends one-time PUT requests via REST API.
 The bridge maintains the light state until changed.
 """
 
-from typing import Optional, List, Dict, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, List, Dict, Tuple
 from dataclasses import dataclass
 
 from lumux.hue_bridge import HueBridge
@@ -26,6 +27,15 @@ class ReadingModeController:
     Uses one-time PUT requests to set light color/brightness.
     No continuous streaming needed - bridge maintains state.
     """
+
+    # Concurrent PUTs per activation; low enough to stay within the
+    # bridge's ~10 light commands per second
+    MAX_PARALLEL_REQUESTS = 4
+
+    # Changes smaller than these are not visible on the lights, so they
+    # are not sent (CIE xy units, brightness steps of 0-254)
+    XY_THRESHOLD = 0.003
+    BRIGHTNESS_THRESHOLD = 2
     
     def __init__(self, bridge: HueBridge, entertainment_config_id: str = ""):
         self.bridge = bridge
@@ -77,18 +87,25 @@ class ReadingModeController:
         timed_print(f"Reading mode: Activating with xy={self._state.color_xy}, "
                    f"brightness={self._state.brightness} for {len(light_ids)} lights")
         
-        success_count = 0
-        for light_id in light_ids:
-            try:
-                self.bridge.set_light_color(
-                    light_id=light_id,
-                    xy=self._state.color_xy,
-                    brightness=self._state.brightness,
-                    transition_time=transition_ms
-                )
-                success_count += 1
-            except Exception as e:
-                timed_print(f"Reading mode: Failed to set light {light_id}: {e}")
+        def set_color(light_id: str):
+            self.bridge.set_light_color(
+                light_id=light_id,
+                xy=self._state.color_xy,
+                brightness=self._state.brightness,
+                transition_time=transition_ms
+            )
+
+        def set_group_color(group_id: str):
+            self.bridge.set_grouped_light_color(
+                group_id=group_id,
+                xy=self._state.color_xy,
+                brightness=self._state.brightness,
+                transition_time=transition_ms
+            )
+
+        success_count = self._for_each_light(
+            light_ids, set_color, "set", group_action=set_group_color
+        )
         
         self._state.is_active = success_count > 0
         
@@ -118,13 +135,19 @@ class ReadingModeController:
             light_ids = self._get_target_light_ids()
             timed_print(f"Reading mode: Turning off {len(light_ids)} lights")
             
-            for light_id in light_ids:
-                try:
-                    # Turn light off via bridge client
-                    if self.bridge.client:
-                        self.bridge.client.set_light_state(light_id, {'on': {'on': False}})
-                except Exception as e:
-                    timed_print(f"Reading mode: Failed to turn off light {light_id}: {e}")
+            client = self.bridge.client
+            if client:
+                # Turn lights off via bridge client
+                self._for_each_light(
+                    light_ids,
+                    lambda light_id: client.set_light_state(
+                        light_id, {'on': {'on': False}}
+                    ),
+                    "turn off",
+                    group_action=lambda group_id: client.set_grouped_light_state(
+                        group_id, {'on': {'on': False}}
+                    ),
+                )
         
         self._state.is_active = False
         timed_print("Reading mode: Deactivated")
@@ -143,9 +166,21 @@ class ReadingModeController:
         Returns:
             True if update succeeded
         """
+        if brightness is None:
+            brightness = self._state.brightness
+        old_x, old_y = self._state.color_xy
+        if (
+            self._state.is_active
+            and abs(xy[0] - old_x) < self.XY_THRESHOLD
+            and abs(xy[1] - old_y) < self.XY_THRESHOLD
+            and abs(brightness - self._state.brightness) < self.BRIGHTNESS_THRESHOLD
+        ):
+            # Lights already show this; don't spend the bridge's rate budget.
+            # The state keeps the last sent values so slow drags still add up
+            return True
+
         self._state.color_xy = xy
-        if brightness is not None:
-            self._state.brightness = brightness
+        self._state.brightness = brightness
         
         if not self._state.is_active:
             # If not active, just update state - don't send
@@ -153,6 +188,78 @@ class ReadingModeController:
         
         return self.activate(transition_ms=transition_ms)
     
+    def _for_each_light(
+        self,
+        light_ids: List[str],
+        action: Callable[[str], None],
+        verb: str,
+        group_action: Optional[Callable[[str], None]] = None,
+    ) -> int:
+        """Run a per-light bridge request for every light concurrently.
+
+        Each request is a separate HTTPS round trip, so sending them in
+        parallel over the pooled session turns N round trips into about
+        N / MAX_PARALLEL_REQUESTS. With group_action, lights that make up
+        a whole bridge zone get one grouped request instead.
+
+        Args:
+            light_ids: Lights to send the request to
+            action: Callable issuing the request for one light ID
+            verb: Action name used in failure messages
+            group_action: Optional callable issuing the same request for
+                one grouped light ID
+
+        Returns:
+            Number of lights whose request did not raise
+        """
+        if group_action is not None:
+            groups, light_ids = self._group_lights(light_ids)
+        else:
+            groups = []
+        jobs = [(action, "light", light_id, 1) for light_id in light_ids]
+        jobs += [
+            (group_action, "group", group_id, size) for group_id, size in groups
+        ]
+
+        def run(job) -> int:
+            job_action, kind, target_id, size = job
+            try:
+                job_action(target_id)
+                return size
+            except Exception as e:
+                timed_print(f"Reading mode: Failed to {verb} {kind} {target_id}: {e}")
+                return 0
+
+        if len(jobs) <= 1:
+            return sum(map(run, jobs))
+
+        workers = min(self.MAX_PARALLEL_REQUESTS, len(jobs))
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="ReadingMode"
+        ) as pool:
+            return sum(pool.map(run, jobs))
+
+    def _group_lights(
+        self, light_ids: List[str]
+    ) -> Tuple[List[Tuple[str, int]], List[str]]:
+        """Cover lights with whole bridge zones where possible.
+
+        Returns:
+            (grouped light ID, light count) for each zone whose lights are
+            all targeted, and the remaining light IDs in their given order
+        """
+        remaining = set(light_ids)
+        groups = []
+        # Largest zones first so they save the most requests
+        for group_id, members in sorted(
+            self.bridge.get_light_groups().items(), key=lambda g: -len(g[1])
+        ):
+            if len(members) > 1 and members <= remaining:
+                groups.append((group_id, len(members)))
+                remaining -= members
+
+        return groups, [light_id for light_id in light_ids if light_id in remaining]
+
     def is_active(self) -> bool:
         """Check if reading mode is currently active."""
         return self._state.is_active
@@ -1,26 +1,33 @@
 """Main sync controller with threading."""
 
-import queue
 import threading
 import time
-from typing import Dict, Optional, Tuple, Callable
+from typing import Dict, List, Optional, Tuple, Callable, TYPE_CHECKING
 
 from lumux.utils.logging import timed_print
 from lumux.hue_bridge import HueBridge
-from lumux.capture import ScreenCapture
-from lumux.zones import ZoneProcessor
-from lumux.colors import ColorAnalyzer
 from lumux.entertainment import EntertainmentStream
 from lumux.config.zone_mapping import ZoneMapping
 
+if TYPE_CHECKING:
+    # Only annotations; importing these loads NumPy and initializes GStreamer
+    from lumux.capture import ScreenCapture
+    from lumux.zones import ZoneProcessor
+    from lumux.colors import ColorAnalyzer
+
 
 class SyncController:
+    # Consecutive slow light updates before the frame rate is halved
+    BACKOFF_FRAMES = 10
+    # Consecutive fast light updates before the frame rate steps back up
+    RECOVER_FRAMES = 30
+
     def __init__(
         self,
         bridge: HueBridge,
-        capture: ScreenCapture,
-        zone_processor: ZoneProcessor,
-        color_analyzer: ColorAnalyzer,
+        capture: "ScreenCapture",
+        zone_processor: "ZoneProcessor",
+        color_analyzer: "ColorAnalyzer",
         zone_mapping: ZoneMapping,
         settings,
         entertainment_stream: Optional[EntertainmentStream] = None,
@@ -36,12 +43,18 @@ class SyncController:
         self.running = False
         self.thread: Optional[threading.Thread] = None
         self.previous_colors: Dict[str, Tuple[Tuple[float, float], int]] = {}
-        self.queue: queue.Queue = queue.Queue(maxsize=100)
         self.lock = threading.Lock()
+        # Newest status for the GUI, guarded by self.lock; the GUI only ever
+        # acts on the latest one, so older ones are simply replaced
+        self._latest_status: Optional[tuple] = None
 
         # Zone to channel mapping for entertainment streaming
         self._zone_channel_map: Dict[str, int] = {}
+        # Channel -> its zones in frame order; built with the map above
+        self._channel_zones: List[Tuple[int, List[str]]] = []
 
+        # Never mutated in place: writers swap in a new dict, so readers get
+        # a consistent snapshot without taking self.lock
         self._stats = {
             "fps": 0,
             "frame_count": 0,
@@ -49,6 +62,12 @@ class SyncController:
             "last_update": time.time(),
         }
 
+        # Frame rate actually aimed for, backed off while the light update
+        # can't keep up with the configured one (see _adapt_fps)
+        self._adaptive_fps: Optional[int] = None
+        self._slow_frames = 0
+        self._fast_frames = 0
+
         # Callback for when sync stops (used for auto-switching to reading mode)
         self._on_stop_callback: Optional[Callable] = None
 
@@ -76,6 +95,10 @@ class SyncController:
         else:
             timed_print("Warning: No entertainment stream configured")
 
+        self._adaptive_fps = None
+        self._slow_frames = 0
+        self._fast_frames = 0
+
         self.running = True
         self.thread = threading.Thread(
             target=self._sync_loop, daemon=True, name="SyncLoop"
@@ -88,6 +111,7 @@ class SyncController:
             return
 
         self._zone_channel_map.clear()
+        self._channel_zones = []
         channel_positions = self.entertainment_stream.get_channel_positions()
 
         if not channel_positions:
@@ -111,6 +135,12 @@ class SyncController:
             if channel_id is not None:
                 self._zone_channel_map[zone_id] = channel_id
 
+        # Invert once so each frame only visits mapped zones per channel
+        channel_zones: Dict[int, List[str]] = {}
+        for zone_id, channel_id in self._zone_channel_map.items():
+            channel_zones.setdefault(channel_id, []).append(zone_id)
+        self._channel_zones = list(channel_zones.items())
+
         timed_print(
             f"Zone-channel mapping: {len(self._zone_channel_map)} zones mapped to {len(set(self._zone_channel_map.values()))} channels"
         )
@@ -211,12 +241,12 @@ class SyncController:
 
         while self.running:
             try:
-                start_time = time.time()
+                start_time = time.monotonic()
 
-                self._process_frame()
+                update_time = self._process_frame() or 0.0
 
                 # Time spent processing the frame (capture + analyze + update)
-                elapsed = time.time() - start_time
+                elapsed = time.monotonic() - start_time
 
                 # Enforce and clamp configured FPS to safe range (1-60)
                 try:
@@ -225,80 +255,124 @@ class SyncController:
                     fps_target = 30
 
                 fps_target = max(1, min(60, fps_target))
-                target_delay = 1.0 / fps_target
+                target_delay = 1.0 / self._adapt_fps(fps_target, update_time)
 
                 # Sleep the remaining time to meet target FPS
                 delay = max(0, target_delay - elapsed)
                 time.sleep(delay)
 
                 # Measure full loop time including sleep to compute real FPS
-                total_time = time.time() - start_time
+                total_time = time.monotonic() - start_time
                 frame_times.append(total_time)
 
                 if len(frame_times) > 30:
                     frame_times.pop(0)
 
                 avg_frame_time = sum(frame_times) / len(frame_times)
-                self._stats["fps"] = 1.0 / avg_frame_time if avg_frame_time > 0 else 0
-                self._stats["frame_count"] += 1
+                stats = self._stats
+                self._stats = {
+                    **stats,
+                    "fps": 1.0 / avg_frame_time if avg_frame_time > 0 else 0,
+                    "frame_count": stats["frame_count"] + 1,
+                }
 
             except KeyboardInterrupt:
                 break
             except Exception as e:
-                self._stats["errors"] += 1
+                self._stats = {**self._stats, "errors": self._stats["errors"] + 1}
                 timed_print(f"Sync loop error: {e}")
                 self._queue_status("error", str(e), None)
                 time.sleep(1)
 
         self._queue_status("status", "stopped", None)
 
-    def _process_frame(self):
-        """Process a single frame."""
-        t0 = time.time()
+    def _adapt_fps(self, fps_target: int, update_time: float) -> int:
+        """Pick the frame rate for the next frame.
+
+        When sending to the lights keeps taking most of the frame budget
+        (e.g. the DTLS helper process is backed up), producing frames
+        faster only queues them up, so the rate is halved. It then climbs
+        back by one FPS for every RECOVER_FRAMES fast sends.
+
+        Args:
+            fps_target: Configured frame rate
+            update_time: Seconds the last light update took
+
+        Returns:
+            Frame rate to aim for, between 1 and fps_target
+        """
+        fps = min(self._adaptive_fps or fps_target, fps_target)
+
+        if update_time > 0.8 / fps:
+            self._fast_frames = 0
+            self._slow_frames += 1
+            if self._slow_frames >= self.BACKOFF_FRAMES:
+                self._slow_frames = 0
+                if fps > 1:
+                    fps = max(1, fps // 2)
+                    timed_print(f"Light updates falling behind, lowering to {fps} FPS")
+        else:
+            self._slow_frames = 0
+            self._fast_frames += 1
+            if fps < fps_target and self._fast_frames >= self.RECOVER_FRAMES:
+                self._fast_frames = 0
+                fps += 1
+
+        self._adaptive_fps = fps
+        return fps
+
+    def _process_frame(self) -> Optional[float]:
+        """Process a single frame.
+
+        Returns:
+            Seconds spent sending to the lights, or None if nothing was sent
+        """
+        # Stage timings are opt-in; only the light update is always timed
+        timed = self.settings.debug_timings
+        if timed:
+            t0 = time.perf_counter()
 
-        t_capture = time.time()
         screen = self.capture.capture()
-        t_capture = time.time() - t_capture
         if screen is None:
             return
+        if timed:
+            t1 = time.perf_counter()
 
-        t_zones = time.time()
         zone_colors = self.zone_processor.process_image(screen)
-        t_zones = time.time() - t_zones
         if not zone_colors or len(zone_colors) == 0:
             return
+        if timed:
+            t2 = time.perf_counter()
 
-        t_analyze = time.time()
         hue_colors = self.color_analyzer.analyze_zones_batch(zone_colors)
-        t_analyze = time.time() - t_analyze
         if not hue_colors or len(hue_colors) == 0:
             return
+        if timed:
+            t3 = time.perf_counter()
 
-        t_smooth = time.time()
         smoothed_colors = self.color_analyzer.apply_smoothing(
             hue_colors, factor=self.settings.smoothing_factor
         )
-        t_smooth = time.time() - t_smooth
-
-        t_update = time.time()
+        t4 = time.perf_counter()
         self._update_lights(smoothed_colors)
-        t_update = time.time() - t_update
-
-        total = time.time() - t0
+        t5 = time.perf_counter()
 
-        # Record latest per-stage timings
-        with self.lock:
-            self._stats["last_stage_times"] = {
-                "capture": round(t_capture, 4),
-                "zones": round(t_zones, 4),
-                "analyze": round(t_analyze, 4),
-                "smooth": round(t_smooth, 4),
-                "update": round(t_update, 4),
-                "total": round(total, 4),
+        if timed:
+            self._stats = {
+                **self._stats,
+                "last_stage_times": {
+                    "capture": round(t1 - t0, 4),
+                    "zones": round(t2 - t1, 4),
+                    "analyze": round(t3 - t2, 4),
+                    "smooth": round(t4 - t3, 4),
+                    "update": round(t5 - t4, 4),
+                    "total": round(t5 - t0, 4),
+                },
             }
 
         # Send RGB colors to GUI for preview, not XY colors
         self._queue_status("status", "syncing", zone_colors)
+        return t5 - t4
 
     def _update_lights(self, hue_colors: Dict[str, Tuple[Tuple[float, float], int]]):
         """Send color updates via entertainment streaming."""
@@ -318,52 +392,54 @@ class SyncController:
         # Convert zone colors to channel colors
         channel_colors: Dict[int, Tuple[Tuple[float, float], int]] = {}
 
-        for zone_id, color_data in hue_colors.items():
-            channel_id = self._zone_channel_map.get(zone_id)
-            if channel_id is None:
-                continue
-
-            xy, brightness = color_data
-
-            # If multiple zones map to the same channel, average them
-            if channel_id in channel_colors:
-                existing_xy, existing_bri = channel_colors[channel_id]
+        for channel_id, zone_ids in self._channel_zones:
+            merged = None
+            for zone_id in zone_ids:
+                color_data = hue_colors.get(zone_id)
+                if color_data is None:
+                    continue
+                if merged is None:
+                    merged = color_data
+                    continue
+
+                # If multiple zones map to the same channel, average them
+                (existing_xy, existing_bri), (xy, brightness) = merged, color_data
                 # Simple average
                 new_xy = ((existing_xy[0] + xy[0]) / 2, (existing_xy[1] + xy[1]) / 2)
                 new_bri = (existing_bri + brightness) // 2
-                channel_colors[channel_id] = (new_xy, new_bri)
-            else:
-                channel_colors[channel_id] = (xy, brightness)
+                merged = (new_xy, new_bri)
+
+            if merged is not None:
+                channel_colors[channel_id] = merged
 
         # Send to all channels via DTLS
         if channel_colors:
             self.entertainment_stream.send_colors_xy(channel_colors)
 
     def _queue_status(self, status_type: str, message, data=None):
-        """Queue status update for GUI thread."""
-        try:
-            self.queue.put_nowait((status_type, message, data))
-        except queue.Full:
-            pass
+        """Publish status update for GUI thread, replacing any unread one."""
+        with self.lock:
+            self._latest_status = (status_type, message, data)
 
     def get_status(self) -> Optional[tuple]:
-        """Get queued status update."""
-        try:
-            return self.queue.get_nowait()
-        except queue.Empty:
-            return None
+        """Take the latest status update, or None if there is none."""
+        with self.lock:
+            status, self._latest_status = self._latest_status, None
+        return status
 
     def get_stats(self) -> dict:
-        """Get sync statistics."""
-        with self.lock:
-            return self._stats.copy()
+        """Get sync statistics.
+
+        The returned dict is a snapshot that may be a frame old; treat it
+        as read-only.
+        """
+        return self._stats
 
     def reset_stats(self):
         """Reset sync statistics."""
-        with self.lock:
-            self._stats = {
-                "fps": 0,
-                "frame_count": 0,
-                "errors": 0,
-                "last_update": time.time(),
-            }
+        self._stats = {
+            "fps": 0,
+            "frame_count": 0,
+            "errors": 0,
+            "last_update": time.time(),
+        }
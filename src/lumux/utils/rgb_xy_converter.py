@@ -1,4 +1,23 @@
-from typing import Tuple, Optional
+from functools import lru_cache
+from typing import Tuple, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# sRGB (D65) <-> CIE XYZ matrices, row-major
+_XYZ_FROM_SRGB = (
+    (0.4124564, 0.3575761, 0.1804375),
+    (0.2126729, 0.7151522, 0.0721750),
+    (0.0193339, 0.1191920, 0.9503041),
+)
+_SRGB_FROM_XYZ = (
+    (3.2406, -1.5372, -0.4986),
+    (-0.9689, 1.8758, 0.0415),
+    (0.0557, -0.2040, 1.0570),
+)
+
+# xy returned for pure black, where chromaticity is undefined
+_BLACK_XY = (0.3227, 0.3290)
 
 
 def _srgb_to_linear(value: float) -> float:
@@ -13,6 +32,29 @@ def _linear_to_srgb(value: float) -> float:
     return 1.055 * (value ** (1.0 / 2.4)) - 0.055
 
 
+@lru_cache(maxsize=4096)
+def _rgb_to_xy_unconstrained(r: int, g: int, b: int) -> Tuple[float, float]:
+    """Convert 8-bit sRGB to CIE xy without gamut clamping.
+
+    Inputs are integer channels, so results are memoized; the sync loop
+    sees the same handful of colors frame after frame.
+    """
+    r_lin = _srgb_to_linear(r / 255.0)
+    g_lin = _srgb_to_linear(g / 255.0)
+    b_lin = _srgb_to_linear(b / 255.0)
+
+    m0, m1, m2 = _XYZ_FROM_SRGB
+    X = r_lin * m0[0] + g_lin * m0[1] + b_lin * m0[2]
+    Y = r_lin * m1[0] + g_lin * m1[1] + b_lin * m1[2]
+    Z = r_lin * m2[0] + g_lin * m2[1] + b_lin * m2[2]
+
+    total = X + Y + Z
+    if total == 0:
+        return _BLACK_XY
+
+    return (X / total, Y / total)
+
+
 def rgb_to_xy(
     r: int,
     g: int,
@@ -20,20 +62,7 @@ def rgb_to_xy(
     light_info: Optional[dict] = None,
     gamut: Optional[dict] = None,
 ) -> Tuple[float, float]:
-    r_norm = _srgb_to_linear(r / 255.0)
-    g_norm = _srgb_to_linear(g / 255.0)
-    b_norm = _srgb_to_linear(b / 255.0)
-
-    X = r_norm * 0.4124564 + g_norm * 0.3575761 + b_norm * 0.1804375
-    Y = r_norm * 0.2126729 + g_norm * 0.7151522 + b_norm * 0.0721750
-    Z = r_norm * 0.0193339 + g_norm * 0.1191920 + b_norm * 0.9503041
-
-    total = X + Y + Z
-    if total == 0:
-        return (0.3227, 0.3290)
-
-    x = X / total
-    y = Y / total
+    x, y = _rgb_to_xy_unconstrained(int(r), int(g), int(b))
 
     if light_info and not gamut:
         gamut = light_info.get("gamut")
@@ -48,6 +77,7 @@ def rgb_to_xy(
     return (x, y)
 
 
+@lru_cache(maxsize=32)
 def xy_to_rgb(x: float, y: float, as_int: bool = True) -> Tuple:
     """Convert CIE XY to RGB.
 
@@ -67,9 +97,10 @@ def xy_to_rgb(x: float, y: float, as_int: bool = True) -> Tuple:
     X = (x * Y) / y
     Z = ((1 - x - y) * Y) / y
 
-    r = X * 3.2406 + Y * -1.5372 + Z * -0.4986
-    g = X * -0.9689 + Y * 1.8758 + Z * 0.0415
-    b = X * 0.0557 + Y * -0.2040 + Z * 1.0570
+    m0, m1, m2 = _SRGB_FROM_XYZ
+    r = X * m0[0] + Y * m0[1] + Z * m0[2]
+    g = X * m1[0] + Y * m1[1] + Z * m1[2]
+    b = X * m2[0] + Y * m2[1] + Z * m2[2]
 
     r = _linear_to_srgb(r)
     g = _linear_to_srgb(g)
@@ -84,6 +115,59 @@ def xy_to_rgb(x: float, y: float, as_int: bool = True) -> Tuple:
     return (r, g, b)
 
 
+def rgb_to_xy_array(rgb: "np.ndarray") -> "np.ndarray":
+    """Vectorized rgb_to_xy for many colors at once (no gamut clamping).
+
+    Args:
+        rgb: Array of shape (N, 3) with channels in the 0-255 range
+
+    Returns:
+        Array of shape (N, 2) with CIE x, y per color
+    """
+    # NumPy is imported here so the GUI, which only needs the scalar
+    # converters, can load this module without it
+    import numpy as np
+
+    c = np.asarray(rgb, dtype=np.float64) / 255.0
+    # Branchless sRGB decode: both sides are computed, the mask picks one
+    lin = np.where(c <= 0.04045, c / 12.92, ((c + 0.055) / 1.055) ** 2.4)
+    xyz = lin @ np.array(_XYZ_FROM_SRGB).T
+
+    total = xyz.sum(axis=1)
+    black = total == 0
+    safe_total = np.where(black, 1.0, total)
+    xy = xyz[:, :2] / safe_total[:, None]
+    xy[black] = _BLACK_XY
+    return xy
+
+
+def xy_to_rgb_array(xy: "np.ndarray") -> "np.ndarray":
+    """Vectorized xy_to_rgb returning floats in the 0-1 range.
+
+    Args:
+        xy: Array of shape (N, 2) with CIE x, y per color
+
+    Returns:
+        Array of shape (N, 3) with r, g, b clipped to 0-1
+    """
+    import numpy as np
+
+    xy = np.asarray(xy, dtype=np.float64)
+    x = xy[:, 0]
+    y = xy[:, 1]
+    undefined = y == 0
+    safe_y = np.where(undefined, 1.0, y)
+
+    xyz = np.stack([x / safe_y, np.ones_like(x), (1 - x - y) / safe_y], axis=1)
+    lin = xyz @ np.array(_SRGB_FROM_XYZ).T
+    # Branchless sRGB encode; clamp first so the power never sees negatives
+    pos = np.maximum(lin, 0.0)
+    rgb = np.where(lin <= 0.0031308, 12.92 * lin, 1.055 * pos ** (1.0 / 2.4) - 0.055)
+    rgb = np.clip(rgb, 0.0, 1.0)
+    rgb[undefined] = 1.0
+    return rgb
+
+
 def _valid_point(point: Optional[dict]) -> bool:
     return isinstance(point, dict) and "x" in point and "y" in point
 
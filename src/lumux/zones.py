@@ -1,7 +1,7 @@
 """Zone processing for screen division."""
 
 import numpy as np
-from typing import Dict, Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from lumux.config.settings_manager import ZoneSettings
@@ -18,9 +18,21 @@ class ZoneProcessor:
             self.rows = rows
             self.cols = cols
         self.zones: Dict[str, tuple[int, int, int]] = {}
+        # Zone IDs per edge (top, bottom, left, right), formatted once per
+        # layout instead of every frame
+        self._zone_ids: Tuple[List[str], ...] = ()
+        self._zone_ids_layout: Optional[Tuple[int, int]] = None
+        self._rebuild_zone_ids()
 
     def _rebuild_zone_ids(self):
         self.zones = {}
+        self._zone_ids = (
+            [f"top_{i}" for i in range(self.cols)],
+            [f"bottom_{i}" for i in range(self.cols)],
+            [f"left_{i}" for i in range(self.rows)],
+            [f"right_{i}" for i in range(self.rows)],
+        )
+        self._zone_ids_layout = (self.rows, self.cols)
 
     def process_image(self, image: np.ndarray) -> Dict[str, tuple[int, int, int]]:
         """Process image and return zone colors.
@@ -54,6 +66,10 @@ class ZoneProcessor:
             edge_width = min(width // self.cols, height // 8)
             edge_width = max(edge_width, 5)
 
+            if self._zone_ids_layout != (self.rows, self.cols):
+                self._rebuild_zone_ids()
+            top_ids, bottom_ids, left_ids, right_ids = self._zone_ids
+
             top_count = self.cols
             bottom_count = self.cols
             left_count = self.rows
@@ -66,43 +82,43 @@ class ZoneProcessor:
 
             zones = {}
 
-            for i in range(top_count):
+            for i, zone_id in enumerate(top_ids):
                 x1 = i * top_zone_width
                 x2 = min((i + 1) * top_zone_width, width)
                 avg_color = np.mean(img_array[0:edge_width, x1:x2], axis=(0, 1))
-                zones[f"top_{i}"] = (
+                zones[zone_id] = (
                     int(avg_color[0]),
                     int(avg_color[1]),
                     int(avg_color[2]),
                 )
 
-            for i in range(bottom_count):
+            for i, zone_id in enumerate(bottom_ids):
                 x1 = i * bottom_zone_width
                 x2 = min((i + 1) * bottom_zone_width, width)
                 y1 = max(0, height - edge_width)
                 avg_color = np.mean(img_array[y1:height, x1:x2], axis=(0, 1))
-                zones[f"bottom_{i}"] = (
+                zones[zone_id] = (
                     int(avg_color[0]),
                     int(avg_color[1]),
                     int(avg_color[2]),
                 )
 
-            for i in range(left_count):
+            for i, zone_id in enumerate(left_ids):
                 y1 = i * left_zone_height
                 y2 = min((i + 1) * left_zone_height, height)
                 avg_color = np.mean(img_array[y1:y2, 0:edge_width], axis=(0, 1))
-                zones[f"left_{i}"] = (
+                zones[zone_id] = (
                     int(avg_color[0]),
                     int(avg_color[1]),
                     int(avg_color[2]),
                 )
 
-            for i in range(right_count):
+            for i, zone_id in enumerate(right_ids):
                 y1 = i * right_zone_height
                 y2 = min((i + 1) * right_zone_height, height)
                 x1 = max(0, width - edge_width)
                 avg_color = np.mean(img_array[y1:y2, x1:width], axis=(0, 1))
-                zones[f"right_{i}"] = (
+                zones[zone_id] = (
                     int(avg_color[0]),
                     int(avg_color[1]),
                     int(avg_color[2]),